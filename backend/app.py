@@ -0,0 +1,179 @@
+# FastAPI backend serving /news, /crisis-data and /donations to the frontends
+#
+# Every response body is a precomputed Payload (orjson + gzip + strong ETag):
+#   - /news pages come from news_articles through the pooled DB layer and are
+#     rebuilt after the scrapers or the summarizer NOTIFY a change;
+#   - /crisis-data and /donations come from crisis_data.json and
+#     donations.csv in BACKEND_DATA_DIR and are rebuilt when a file changes.
+# A matching If-None-Match gets a 304 without a body.
+#
+#   uvicorn backend.app:app --port 8000
+#   docker compose up    # Postgres stand-in + seeded fixture articles, see docker-compose.yml
+
+import csv
+import os
+import select
+import threading
+from contextlib import asynccontextmanager
+
+import orjson
+import psycopg2
+from fastapi import FastAPI, HTTPException, Query, Request
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import Response
+
+from backend.payloads import PayloadCache
+from news.article_store import SUMMARY_QUEUE_CHANNEL, SUMMARY_SAVED_CHANNEL
+from news.db_connection import db_connection, get_db_connection
+from news.feed import DEFAULT_LIMIT, MAX_LIMIT, decode_cursor, fetch_feed, parse_fields
+
+BACKEND_DATA_DIR = os.getenv('BACKEND_DATA_DIR', os.path.join(os.path.dirname(__file__), "data"))
+CORS_ORIGINS = [origin.strip() for origin in os.getenv('BACKEND_CORS_ORIGINS', '*').split(",")]
+NEWS_MAX_AGE = float(os.getenv('BACKEND_NEWS_MAX_AGE', 300))  # Seconds; covers NOTIFYs lost while reconnecting
+NEWS_CACHE_ENTRIES = int(os.getenv('BACKEND_NEWS_CACHE_ENTRIES', 512))
+NOTIFY_DEBOUNCE = 0.5  # Seconds to collect a burst of NOTIFYs into one rebuild
+NEWS_CHANNELS = (SUMMARY_QUEUE_CHANNEL, SUMMARY_SAVED_CHANNEL)
+
+news_payloads = PayloadCache(max_entries=NEWS_CACHE_ENTRIES, max_age=NEWS_MAX_AGE)
+file_payloads = PayloadCache(max_entries=8)
+
+
+def _data_path(name):
+    return os.path.join(BACKEND_DATA_DIR, name)
+
+
+def _file_signature(path):
+    try:
+        stat = os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=503, detail=f"{os.path.basename(path)} is not available")
+    return stat.st_mtime_ns, stat.st_size
+
+
+def _read_crisis_data(path):
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def _read_donations(path):
+    """Rows of donations.csv; locations is a comma-separated cell, verified true/false."""
+    with open(path, newline="", encoding="utf-8") as f:
+        return [{
+            "name": row["name"],
+            "category": row["category"].strip().lower(),
+            "locations": [loc.strip() for loc in (row.get("locations") or "").split(",") if loc.strip()],
+            "verified": (row.get("verified") or "").strip().lower() in ("1", "true", "yes"),
+            "url": row["url"],
+            "description": row.get("description") or "",
+        } for row in csv.DictReader(f)]
+
+
+def _news_key(limit, cursor, language, source, fields, summarized):
+    if cursor:
+        decode_cursor(cursor)  # Reject a malformed cursor before it takes a pooled connection
+    return (max(1, min(limit, MAX_LIMIT)), cursor or None, language or None, source or None, parse_fields(fields),
+            bool(summarized))
+
+
+def _build_news(key):
+    with db_connection() as conn:
+        return fetch_feed(conn, *key)
+
+
+def _refresh_first_pages():
+    """Invalidate the feed and rebuild the first pages that were being served."""
+    news_payloads.invalidate()
+    for key in news_payloads.keys():
+        if key[1] is None:
+            try:
+                news_payloads.get(key, lambda key=key: _build_news(key))
+            except psycopg2.Error as e:
+                print(f"⚠️ Could not rebuild the news feed: {e}")
+                return
+
+
+def _watch_news(stop):
+    """LISTEN for article and summary changes until stop is set, reconnecting on errors."""
+    while not stop.is_set():
+        conn = None
+        try:
+            conn = get_db_connection()  # Dedicated connection; LISTEN does not belong in the pool
+            conn.autocommit = True
+            with conn.cursor() as cur:
+                for channel in NEWS_CHANNELS:
+                    cur.execute(f"LISTEN {channel}")
+            _refresh_first_pages()  # Anything may have changed while we were not listening
+            while not stop.is_set():
+                if select.select([conn], [], [], 1.0) == ([], [], []):
+                    continue
+                conn.poll()
+                if conn.notifies:
+                    stop.wait(NOTIFY_DEBOUNCE)
+                    conn.poll()
+                    conn.notifies.clear()
+                    _refresh_first_pages()
+        except psycopg2.Error as e:
+            print(f"❌ News change listener disconnected, retrying: {e}")
+            stop.wait(5)
+        finally:
+            if conn is not None and not conn.closed:
+                conn.close()
+
+
+@asynccontextmanager
+async def lifespan(app):
+    stop = threading.Event()
+    watcher = threading.Thread(target=_watch_news, args=(stop,), name="news-listener", daemon=True)
+    watcher.start()
+    yield
+    stop.set()
+    watcher.join(timeout=5)
+
+
+app = FastAPI(title="Myanmar Crisis Relief Dashboard backend", lifespan=lifespan)
+app.add_middleware(CORSMiddleware, allow_origins=CORS_ORIGINS, allow_methods=["GET"], expose_headers=["ETag"])
+
+
+def payload_response(request, payload):
+    """Serve payload gzip-encoded when accepted, or a 304 if the client already has it."""
+    use_gzip = payload.gzipped is not None and "gzip" in request.headers.get("accept-encoding", "")
+    headers = {
+        "ETag": payload.gzip_etag if use_gzip else payload.etag,
+        "Cache-Control": "no-cache",  # Always revalidate; an unchanged payload costs a 304
+        "Vary": "Accept-Encoding",
+    }
+    if payload.matches(request.headers.get("if-none-match")):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(payload.gzipped, media_type="application/json", headers=headers)
+    return Response(payload.body, media_type="application/json", headers=headers)
+
+
+@app.get("/news")
+def news(request: Request, limit: int = Query(DEFAULT_LIMIT, ge=1, le=MAX_LIMIT), cursor: str = None,
+         language: str = None, source: str = None, fields: str = None, summarized: bool = False):
+    """One page of the news feed; see news/feed.py for the contract."""
+    try:
+        key = _news_key(limit, cursor, language, source, fields, summarized)
+        payload = news_payloads.get(key, lambda: _build_news(key))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except psycopg2.Error as e:
+        print(f"❌ News query failed: {e}")
+        raise HTTPException(status_code=503, detail="News database unavailable")
+    return payload_response(request, payload)
+
+
+@app.get("/crisis-data")
+def crisis_data(request: Request):
+    path = _data_path("crisis_data.json")
+    payload = file_payloads.get("crisis-data", lambda: _read_crisis_data(path), _file_signature(path))
+    return payload_response(request, payload)
+
+
+@app.get("/donations")
+def donations(request: Request):
+    path = _data_path("donations.csv")
+    payload = file_payloads.get("donations", lambda: _read_donations(path), _file_signature(path))
+    return payload_response(request, payload)
@@ -0,0 +1,124 @@
+# Precomputed JSON responses: serialized and gzip-compressed once per data version
+#
+# A Payload holds the orjson body, its gzip encoding and a strong ETag, so a
+# request for unchanged data costs a dict lookup and a header comparison.
+# PayloadCache keeps payloads until the data they came from changes: either
+# invalidate() is called (a NOTIFY from the database) or the caller-supplied
+# signature differs (a data file's mtime), with max_age as a safety net.
+
+import gzip
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+import orjson
+
+GZIP_MIN_BYTES = 512  # Smaller bodies are not worth the Content-Encoding
+
+
+@dataclass(frozen=True)
+class Payload:
+    body: bytes
+    gzipped: bytes  # None when the body is below GZIP_MIN_BYTES
+    etag: str  # Strong validator of the identity body, quoted
+
+    @classmethod
+    def from_data(cls, data):
+        body = orjson.dumps(data)
+        digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+        gzipped = gzip.compress(body, compresslevel=6, mtime=0) if len(body) >= GZIP_MIN_BYTES else None
+        return cls(body, gzipped, f'"{digest}"')
+
+    @property
+    def gzip_etag(self):
+        # A different encoding is a different representation, so it needs its own strong ETag
+        return f'{self.etag[:-1]}-gzip"'
+
+    def matches(self, if_none_match):
+        """True if an If-None-Match header names either representation of this payload."""
+        if not if_none_match:
+            return False
+        if if_none_match.strip() == "*":
+            return True
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return self.etag in tags or self.gzip_etag in tags
+
+
+class PayloadCache:
+    """LRU of Payloads keyed by request parameters, rebuilt when their data changes.
+
+    Concurrent requests for the same missing key wait for a single build
+    instead of all querying the database.
+    """
+
+    def __init__(self, max_entries=256, max_age=None):
+        self.max_entries = max_entries
+        self.max_age = max_age  # Seconds; None keeps payloads until invalidated
+        self.generation = 0
+        self.builds = 0
+        self._entries = OrderedDict()  # key -> (generation, signature, built_at, Payload)
+        self._building = {}  # key -> Lock held by the thread building it
+        self._lock = threading.Lock()
+
+    def invalidate(self):
+        """Mark every payload stale; each is rebuilt on its next request."""
+        with self._lock:
+            self.generation += 1
+
+    def keys(self):
+        with self._lock:
+            return list(self._entries)
+
+    def _fresh(self, key, signature):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        generation, built_signature, built_at, payload = entry
+        if generation != self.generation or built_signature != signature:
+            return None
+        if self.max_age is not None and time.monotonic() - built_at > self.max_age:
+            return None
+        self._entries.move_to_end(key)
+        return payload
+
+    def get(self, key, build, signature=None):
+        """Return the payload of key, calling build() for its data if it is missing or stale.
+
+        Args:
+            key: Hashable request parameters
+            build: Zero-argument callable returning JSON-serializable data
+            signature: Version of the underlying data, e.g. a file's mtime;
+                a payload built under another signature is stale
+
+        Returns:
+            Payload
+        """
+        with self._lock:
+            payload = self._fresh(key, signature)
+            if payload is not None:
+                return payload
+            building = self._building.setdefault(key, threading.Lock())
+
+        with building:
+            with self._lock:
+                payload = self._fresh(key, signature)  # Built while we waited
+                if payload is not None:
+                    return payload
+                generation = self.generation
+            try:
+                # Data changed during the build is caught by the generation check next time
+                payload = Payload.from_data(build())
+            except Exception:
+                with self._lock:
+                    self._building.pop(key, None)
+                raise
+            with self._lock:
+                self.builds += 1
+                self._entries[key] = (generation, signature, time.monotonic(), payload)
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+                self._building.pop(key, None)
+        return payload
@@ -0,0 +1,61 @@
+# Fill a local news_articles table from the benchmark fixture for load testing the backend
+#
+# Each copy of the fixture gets its own URLs and publication times a few
+# minutes apart, so the feed has as many pages as needed. --summarize writes
+# extractive summaries right away (no model download); they are flagged for
+# an abstractive upgrade like any surge summary.
+#
+#   python -m backend.seed --copies 500 --summarize
+
+import argparse
+import json
+import os
+from datetime import datetime, timedelta
+
+from news.article_store import upsert_articles
+from news.dates import MYANMAR_TZ
+from news.db_connection import create_news_table, db_connection
+from news.summary_worker import process_batch
+
+FIXTURE_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                            "benchmarks", "fixtures", "myanmar_now_en.jsonl")
+NEWS_SOURCE = "Myanmar Now"
+
+
+def fixture_rows(path, copies, start=None):
+    """Rows in ARTICLE_COLUMNS order, newest first, 5 minutes apart."""
+    with open(path, encoding="utf-8") as f:
+        articles = [json.loads(line) for line in f if line.strip()]
+    # Labels without a zone are read as Myanmar time by parse_published_at()
+    published_at = start or datetime.now(MYANMAR_TZ).replace(second=0, microsecond=0)
+    rows = []
+    for copy in range(copies):
+        for article in articles:
+            rows.append((NEWS_SOURCE, article["title"], article["excerpt"], article["text"],
+                         f"{article['url']}?copy={copy}", published_at.strftime("%Y-%m-%d %H:%M:%S"),
+                         article.get("language")))
+            published_at -= timedelta(minutes=5)
+    return rows
+
+
+def seed(path, copies, summarize=False, batch_size=1000):
+    create_news_table()
+    rows = fixture_rows(path, copies)
+    written = 0
+    with db_connection() as conn:
+        for i in range(0, len(rows), batch_size):
+            written += upsert_articles(conn, rows[i:i + batch_size])
+    print(f"✅ Seeded {written} new or changed articles out of {len(rows)}.")
+    if summarize:
+        with db_connection() as conn:
+            while process_batch(conn, None, batch_size, extractive=True):
+                pass
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Load fixture articles into news_articles")
+    parser.add_argument("--fixture", default=FIXTURE_PATH)
+    parser.add_argument("--copies", type=int, default=100, help="times to repeat the fixture under new URLs")
+    parser.add_argument("--summarize", action="store_true", help="write extractive summaries as well")
+    args = parser.parse_args()
+    seed(args.fixture, args.copies, args.summarize)
@@ -0,0 +1,80 @@
+# Load test for the local backend (backend/app.py)
+#
+# Sends --requests GETs per path from --concurrency threads and reports
+# requests/s, p50/p95/p99 latency, status codes and bytes on the wire.
+# With --revalidate every client sends back the ETag it got, the way the
+# frontend's fetch cache does, so unchanged payloads come back as 304s.
+#
+#   uvicorn backend.app:app --port 8000 --workers 4
+#   python -m benchmarks.backend_load --concurrency 32 --requests 2000 --revalidate
+
+import argparse
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+import requests
+
+from benchmarks.stats import percentile
+
+DEFAULT_PATHS = ["/news", "/news?language=en&limit=50", "/crisis-data", "/donations"]
+
+_local = threading.local()
+
+
+def _session():
+    if not hasattr(_local, "session"):
+        _local.session = requests.Session()
+        _local.etags = {}
+    return _local.session, _local.etags
+
+
+def _get(url, revalidate):
+    session, etags = _session()
+    headers = {"If-None-Match": etags[url]} if revalidate and url in etags else {}
+    start = time.perf_counter()
+    response = session.get(url, headers=headers, stream=True)
+    raw = response.raw.read(decode_content=False)  # Bytes on the wire, before gzip decoding
+    seconds = time.perf_counter() - start
+    if response.headers.get("ETag"):
+        etags[url] = response.headers["ETag"]
+    return response.status_code, len(raw), seconds
+
+
+def run(base_url, path, total, concurrency, revalidate):
+    url = base_url.rstrip("/") + path
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        results = list(executor.map(lambda _: _get(url, revalidate), range(total)))
+    seconds = time.perf_counter() - start
+    latencies = [r[2] for r in results]
+    return {
+        "path": path,
+        "rps": round(total / seconds, 1),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 1),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 1),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 1),
+        "statuses": dict(Counter(r[0] for r in results)),
+        "kb_per_request": round(sum(r[1] for r in results) / total / 1024, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test the backend endpoints")
+    parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+    parser.add_argument("--paths", nargs="+", default=DEFAULT_PATHS)
+    parser.add_argument("--requests", type=int, default=1000, help="requests per path")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--revalidate", action="store_true", help="send If-None-Match with the last ETag seen")
+    args = parser.parse_args()
+
+    print(f"{'path':<32}{'req/s':>9}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'KB/req':>9}  statuses")
+    for path in args.paths:
+        r = run(args.base_url, path, args.requests, args.concurrency, args.revalidate)
+        print(f"{r['path']:<32}{r['rps']:>9}{r['p50_ms']:>9}{r['p95_ms']:>9}{r['p99_ms']:>9}"
+              f"{r['kb_per_request']:>9}  {r['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Startup-cost guard: importing the summarizer modules must stay cheap
+#
+# Each module is imported in a fresh interpreter. The run fails when one of
+# them pulls in a heavy dependency (torch, transformers, scipy) at import
+# time or takes longer than --max-seconds.
+#
+#   python -m benchmarks.import_time --max-seconds 1.0
+
+import argparse
+import json
+import subprocess
+import sys
+
+MODULES = ["news.summarizer", "news.summarizer_backends", "news.summary_worker", "news.summary_pool",
+           "news.text_normalize", "benchmarks.summarizers", "benchmarks.backend_load"]
+HEAVY_MODULES = ["torch", "transformers", "scipy"]
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "heavy": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(module, repeat):
+    """Best-of-repeat import time of module in a fresh interpreter."""
+    runs = []
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", PROBE.format(module=module, heavy=HEAVY_MODULES)],
+                                capture_output=True, text=True, check=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    best = min(runs, key=lambda run: run["seconds"])
+    return {"module": module, "seconds": round(best["seconds"], 3), "heavy_imports": best["heavy"]}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Guard the import time of the summarizer modules")
+    parser.add_argument("--max-seconds", type=float, default=1.0, help="import budget per module")
+    parser.add_argument("--repeat", type=int, default=3, help="fresh interpreters per module")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    results = [measure(module, args.repeat) for module in MODULES]
+    failed = False
+    for result in results:
+        problems = []
+        if result["heavy_imports"]:
+            problems.append(f"imports {', '.join(result['heavy_imports'])}")
+        if result["seconds"] > args.max_seconds:
+            problems.append(f"over the {args.max_seconds:.2f}s budget")
+        failed = failed or bool(problems)
+        status = f"❌ {'; '.join(problems)}" if problems else "✅"
+        print(f"{result['module']:<24}{result['seconds']:>8.3f}s  {status}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Results written to {args.json}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
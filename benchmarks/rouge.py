@@ -0,0 +1,50 @@
+# Minimal ROUGE-1/2/L F1 so the benchmarks need no extra dependency
+
+import re
+from collections import Counter
+
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def _tokens(text):
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _f1(overlap, candidate_total, reference_total):
+    if not overlap or not candidate_total or not reference_total:
+        return 0.0
+    precision = overlap / candidate_total
+    recall = overlap / reference_total
+    return 2 * precision * recall / (precision + recall)
+
+
+def rouge_n(candidate, reference, n):
+    cand, ref = _tokens(candidate), _tokens(reference)
+    cand_ngrams = Counter(zip(*(cand[i:] for i in range(n))))
+    ref_ngrams = Counter(zip(*(ref[i:] for i in range(n))))
+    overlap = sum((cand_ngrams & ref_ngrams).values())
+    return _f1(overlap, sum(cand_ngrams.values()), sum(ref_ngrams.values()))
+
+
+def rouge_l(candidate, reference):
+    cand, ref = _tokens(candidate), _tokens(reference)
+    # Longest common subsequence, one DP row at a time
+    previous = [0] * (len(ref) + 1)
+    for token in cand:
+        current = [0]
+        for j, ref_token in enumerate(ref, start=1):
+            current.append(previous[j - 1] + 1 if token == ref_token else max(previous[j], current[j - 1]))
+        previous = current
+    return _f1(previous[-1], len(cand), len(ref))
+
+
+def rouge_scores(candidates, references):
+    """Average ROUGE-1/2/L F1 over aligned candidate/reference lists."""
+    pairs = list(zip(candidates, references))
+    if not pairs:
+        return {"rouge1": 0.0, "rouge2": 0.0, "rougeL": 0.0}
+    return {
+        "rouge1": sum(rouge_n(c, r, 1) for c, r in pairs) / len(pairs),
+        "rouge2": sum(rouge_n(c, r, 2) for c, r in pairs) / len(pairs),
+        "rougeL": sum(rouge_l(c, r) for c, r in pairs) / len(pairs),
+    }
@@ -0,0 +1,9 @@
+# Small statistics helpers shared by the benchmarks, with no dependencies
+
+import math
+
+
+def percentile(values, q):
+    """Nearest-rank percentile, q in [0, 1]."""
+    ordered = sorted(values)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
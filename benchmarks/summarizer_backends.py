@@ -0,0 +1,102 @@
+# Compare summarizer inference backends on stored articles
+#
+# Reports load time, per-batch latency, throughput and ROUGE drift of each
+# backend's summaries against the eager fp32 "torch" baseline.
+#
+#   python -m benchmarks.summarizer_backends --backends torch torch-int8 onnx --limit 32
+
+import argparse
+import json
+import statistics
+import time
+
+from benchmarks.rouge import rouge_scores
+from news.config import SUMMARIZER_CONFIG
+from news.db_connection import db_cursor
+from news.summarizer import TextSummarizer, preprocess_text
+from news.summary_cache import SummaryCache
+from news.summarizer_backends import BACKENDS
+
+BASELINE_BACKEND = "torch"
+
+
+def load_articles(limit):
+    with db_cursor() as cur:
+        cur.execute("""
+            SELECT text
+            FROM news_articles
+            WHERE "language" IS DISTINCT FROM 'MM'
+            ORDER BY published_at DESC, id DESC
+            LIMIT %s
+        """, (limit,))
+        return [preprocess_text(row[0]) for row in cur.fetchall()]
+
+
+def run_backend(backend, model_name, texts, batch_size):
+    start = time.perf_counter()
+    summarizer = TextSummarizer(model_name, backend=backend, cache=SummaryCache.disabled())
+    load_seconds = time.perf_counter() - start
+
+    summaries, batch_latencies = [], []
+    start = time.perf_counter()
+    for i in range(0, len(texts), batch_size):
+        batch_start = time.perf_counter()
+        batch = summarizer.summarize_batch(texts[i:i + batch_size], batch_size=batch_size)
+        if None in batch:
+            raise RuntimeError(f"generation failed on the {backend} backend")
+        summaries.extend(batch)
+        batch_latencies.append(time.perf_counter() - batch_start)
+    total_seconds = time.perf_counter() - start
+
+    return summaries, {
+        "backend": backend,
+        "load_s": round(load_seconds, 2),
+        "batch_p50_s": round(statistics.median(batch_latencies), 3),
+        "batch_max_s": round(max(batch_latencies), 3),
+        "articles_per_s": round(len(texts) / total_seconds, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark summarizer inference backends")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS), choices=list(BACKENDS))
+    parser.add_argument("--model", default="sshleifer/distilbart-cnn-12-6")
+    parser.add_argument("--limit", type=int, default=32, help="number of stored articles to summarize")
+    parser.add_argument("--batch-size", type=int, default=SUMMARIZER_CONFIG['batch_size'])
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    texts = load_articles(args.limit)
+    if not texts:
+        print("❌ No articles to benchmark.")
+        return
+
+    # The baseline always runs first so every other backend can be compared to it
+    backends = [BASELINE_BACKEND] + [b for b in args.backends if b != BASELINE_BACKEND]
+    results, baseline = [], None
+    for backend in backends:
+        try:
+            summaries, result = run_backend(backend, args.model, texts, args.batch_size)
+        except (ImportError, RuntimeError) as e:
+            print(f"⚠️ Skipping {backend}: {e}")
+            continue
+        if baseline is None:
+            baseline = summaries
+        result.update({k: round(v, 4) for k, v in rouge_scores(summaries, baseline).items()})
+        results.append(result)
+        print(json.dumps(result))
+
+    print(f"\n{len(texts)} articles, batch size {args.batch_size}, ROUGE F1 vs {BASELINE_BACKEND}")
+    print(f"{'backend':<12}{'load s':>8}{'p50 s':>8}{'art/s':>8}{'R-1':>8}{'R-2':>8}{'R-L':>8}")
+    for r in results:
+        print(f"{r['backend']:<12}{r['load_s']:>8}{r['batch_p50_s']:>8}{r['articles_per_s']:>8}"
+              f"{r['rouge1']:>8}{r['rouge2']:>8}{r['rougeL']:>8}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"model": args.model, "articles": len(texts), "batch_size": args.batch_size,
+                       "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+# Articles/sec of the multi-process summarizer as the process count changes
+#
+#   python -m benchmarks.summarizer_workers --workers 1 2 4 8 --limit 64
+
+import argparse
+import json
+import os
+import time
+
+from benchmarks.summarizer_backends import load_articles
+from news.config import SUMMARIZER_CONFIG
+from news.summary_pool import ProcessPoolSummarizer
+
+
+def run(processes, threads, texts, batch_size, model_name):
+    with ProcessPoolSummarizer(processes, threads, model_name=model_name) as pool:
+        # Warm every process up so model loading is not timed
+        pool.summarize_documents(texts[:processes], batch_size=1, shard_size=1)
+        start = time.perf_counter()
+        pool.summarize_documents(texts, batch_size=batch_size)
+        seconds = time.perf_counter() - start
+    return {
+        "processes": processes,
+        "threads_per_process": pool.threads_per_process,
+        "seconds": round(seconds, 2),
+        "articles_per_s": round(len(texts) / seconds, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark multi-process summarization")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--threads", type=int, help="torch threads per process (default: cores / processes)")
+    parser.add_argument("--model", default="sshleifer/distilbart-cnn-12-6")
+    parser.add_argument("--limit", type=int, default=64, help="number of stored articles to summarize")
+    parser.add_argument("--batch-size", type=int, default=SUMMARIZER_CONFIG['batch_size'])
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    # Spawned pool processes read this at import; cached summaries would skew timings
+    os.environ["SUMMARY_CACHE_BYPASS"] = "1"
+    texts = load_articles(args.limit)
+    if not texts:
+        print("❌ No articles to benchmark.")
+        return
+
+    results = []
+    for processes in args.workers:
+        result = run(processes, args.threads, texts, args.batch_size, args.model)
+        results.append(result)
+        print(json.dumps(result))
+
+    print(f"\n{len(texts)} articles on {os.cpu_count()} cores, batch size {args.batch_size}")
+    print(f"{'processes':>10}{'threads':>9}{'seconds':>9}{'art/s':>9}{'speedup':>9}")
+    for r in results:
+        speedup = r["articles_per_s"] / results[0]["articles_per_s"]
+        print(f"{r['processes']:>10}{r['threads_per_process']:>9}{r['seconds']:>9}"
+              f"{r['articles_per_s']:>9}{speedup:>9.2f}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump({"model": args.model, "articles": len(texts), "batch_size": args.batch_size,
+                       "cores": os.cpu_count(), "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,241 @@
+# Reproducible summarizer benchmark on a committed fixture corpus
+#
+# Runs BART, Pegasus and T5 under each requested backend and batch size on
+# benchmarks/fixtures/myanmar_now_en.jsonl and reports input/output tokens per
+# second, p50/p95 per-article latency, peak RSS and ROUGE against the article
+# excerpts. No database or network is used: models are loaded from the local
+# Hugging Face cache (fill it with --allow-download or `python -m
+# news.summarizer warmup`). Every (model, backend) pair runs in a fresh
+# interpreter so its peak RSS is its own.
+#
+# The fixture articles are hand-written stand-ins modelled on Myanmar Now
+# earthquake coverage; --export-fixture rebuilds the file from news_articles.
+#
+#   python -m benchmarks.summarizers --models bart t5 --batch-sizes 1 8 --output results.json
+#   python -m benchmarks.summarizers --baseline results.json   # exits 1 on a regression
+
+import argparse
+import hashlib
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+from benchmarks.stats import percentile
+from news.summarizer_backends import BACKENDS
+
+MODELS = {
+    "bart": "sshleifer/distilbart-cnn-12-6",
+    "pegasus": "google/pegasus-xsum",
+    "t5": "t5-base",
+}
+FIXTURE_PATH = os.path.join(os.path.dirname(__file__), "fixtures", "myanmar_now_en.jsonl")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Relative drop in throughput / rise in p95 latency, and absolute ROUGE-L drop, that count as regressions
+DEFAULT_TOLERANCE = 0.10
+ROUGE_TOLERANCE = 0.02
+
+
+def load_fixture(path=FIXTURE_PATH):
+    with open(path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def export_fixture(path, limit):
+    """Write the latest non-Burmese stored articles to path in the fixture format."""
+    from news.db_connection import db_cursor
+
+    with db_cursor() as cur:
+        cur.execute("""
+            SELECT url, article_title, excerpt, text, "language"
+            FROM news_articles
+            WHERE "language" IS DISTINCT FROM 'MM' AND excerpt <> ''
+            ORDER BY published_at DESC, id DESC
+            LIMIT %s
+        """, (limit,))
+        rows = cur.fetchall()
+    with open(path, "w", encoding="utf-8") as f:
+        for url, title, excerpt, text, language in rows:
+            f.write(json.dumps({"url": url, "title": title, "excerpt": excerpt, "text": text,
+                                "language": language}, ensure_ascii=False) + "\n")
+    print(f"✅ {len(rows)} articles written to {path}")
+
+
+def peak_rss_mb():
+    import resource
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return peak / 1024 if sys.platform != "darwin" else peak / (1024 * 1024)
+
+
+def run_model(model, backend, batch_sizes, fixture_path):
+    """Benchmark one model/backend in this process; returns one result per batch size."""
+    import torch
+    import transformers
+    from benchmarks.rouge import rouge_scores
+    from news.summarizer import TextSummarizer, preprocess_text
+    from news.summary_cache import SummaryCache
+
+    articles = load_fixture(fixture_path)
+    texts = [preprocess_text(article["text"]) for article in articles]
+    references = [article["excerpt"] for article in articles]
+
+    start = time.perf_counter()
+    summarizer = TextSummarizer(MODELS.get(model, model), backend=backend, cache=SummaryCache.disabled())
+    load_seconds = time.perf_counter() - start
+    summarizer.summarize_documents(texts[:1], batch_size=1)  # Warm-up, not timed
+
+    input_tokens = sum(len(ids) for ids in summarizer.tokenizer(texts)["input_ids"])
+    results = []
+    for batch_size in batch_sizes:
+        summaries, latencies = [], []
+        start = time.perf_counter()
+        for i in range(0, len(texts), batch_size):
+            batch_start = time.perf_counter()
+            batch = summarizer.summarize_documents(texts[i:i + batch_size], batch_size=batch_size)
+            if None in batch:
+                raise RuntimeError("generation failed")  # Reported by run_isolated() as a skipped configuration
+            # Every article of a batch waits for the whole batch
+            latencies.extend([time.perf_counter() - batch_start] * len(batch))
+            summaries.extend(batch)
+        seconds = time.perf_counter() - start
+
+        output_tokens = sum(len(ids) for ids in summarizer.tokenizer(summaries, add_special_tokens=False)["input_ids"])
+        result = {
+            "model": model,
+            "backend": summarizer.backend.name,
+            "batch_size": batch_size,
+            "articles": len(texts),
+            "load_s": round(load_seconds, 2),
+            "seconds": round(seconds, 3),
+            "input_tokens_per_s": round(input_tokens / seconds, 1),
+            "output_tokens_per_s": round(output_tokens / seconds, 1),
+            "latency_p50_s": round(percentile(latencies, 0.50), 3),
+            "latency_p95_s": round(percentile(latencies, 0.95), 3),
+        }
+        result.update({k: round(v, 4) for k, v in rouge_scores(summaries, references).items()})
+        results.append(result)
+
+    peak = round(peak_rss_mb(), 1)
+    for result in results:
+        result["peak_rss_mb"] = peak  # Process-wide high-water mark across the batch sizes
+    environment = {"torch": torch.__version__, "transformers": transformers.__version__,
+                   "threads": torch.get_num_threads()}
+    return results, environment
+
+
+def run_isolated(model, backend, batch_sizes, fixture_path, allow_download):
+    """Run run_model() in a fresh interpreter; returns (results, environment) or None on failure."""
+    env = dict(os.environ)
+    if not allow_download:
+        env["HF_HUB_OFFLINE"] = "1"
+    command = [sys.executable, "-m", "benchmarks.summarizers", "--worker", model, backend,
+               "--fixture", fixture_path, "--batch-sizes", *map(str, batch_sizes)]
+    completed = subprocess.run(command, cwd=REPO_ROOT, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        error = (completed.stderr.strip().splitlines() or ["unknown error"])[-1]
+        print(f"⚠️ Skipping {model} on {backend}: {error}")
+        return None
+    return json.loads(completed.stdout.strip().splitlines()[-1])
+
+
+def find_regressions(results, baseline, tolerance):
+    """Compare results with a previous run, matched on (model, backend, batch_size)."""
+    previous = {(r["model"], r["backend"], r["batch_size"]): r for r in baseline["results"]}
+    regressions = []
+    for result in results:
+        old = previous.get((result["model"], result["backend"], result["batch_size"]))
+        if old is None:
+            continue
+        label = f"{result['model']}/{result['backend']}/bs{result['batch_size']}"
+        if result["input_tokens_per_s"] < old["input_tokens_per_s"] * (1 - tolerance):
+            regressions.append(f"{label}: {old['input_tokens_per_s']} -> {result['input_tokens_per_s']} tokens/s")
+        if result["latency_p95_s"] > old["latency_p95_s"] * (1 + tolerance):
+            regressions.append(f"{label}: p95 {old['latency_p95_s']}s -> {result['latency_p95_s']}s")
+        if result["rougeL"] < old["rougeL"] - ROUGE_TOLERANCE:
+            regressions.append(f"{label}: ROUGE-L {old['rougeL']} -> {result['rougeL']}")
+    return regressions
+
+
+def print_table(results):
+    print(f"{'model':<10}{'backend':<12}{'batch':>6}{'in tok/s':>10}{'out tok/s':>10}"
+          f"{'p50 s':>8}{'p95 s':>8}{'RSS MB':>9}{'R-1':>8}{'R-2':>8}{'R-L':>8}")
+    for r in results:
+        print(f"{r['model']:<10}{r['backend']:<12}{r['batch_size']:>6}{r['input_tokens_per_s']:>10}"
+              f"{r['output_tokens_per_s']:>10}{r['latency_p50_s']:>8}{r['latency_p95_s']:>8}"
+              f"{r['peak_rss_mb']:>9}{r['rouge1']:>8}{r['rouge2']:>8}{r['rougeL']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark summarization models on the fixture corpus")
+    parser.add_argument("--models", nargs="+", default=list(MODELS),
+                        help=f"model keys ({', '.join(MODELS)}) or Hugging Face model names")
+    parser.add_argument("--backends", nargs="+", default=["torch"], choices=list(BACKENDS))
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--fixture", default=FIXTURE_PATH)
+    parser.add_argument("--output", help="write machine-readable results to this JSON file")
+    parser.add_argument("--baseline", help="previous --output file; exit 1 if this run regresses against it")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE,
+                        help="relative throughput/latency change allowed against the baseline")
+    parser.add_argument("--allow-download", action="store_true", help="let models be fetched from the hub")
+    parser.add_argument("--export-fixture", type=int, metavar="N",
+                        help="write the latest N stored articles to --fixture and exit (needs the database)")
+    parser.add_argument("--worker", nargs=2, metavar=("MODEL", "BACKEND"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.export_fixture:
+        export_fixture(args.fixture, args.export_fixture)
+        return
+    if args.worker:
+        print(json.dumps(run_model(*args.worker, args.batch_sizes, args.fixture)))
+        return
+
+    with open(args.fixture, "rb") as f:
+        fixture_sha256 = hashlib.sha256(f.read()).hexdigest()
+    results, environment = [], {}
+    for model in args.models:
+        for backend in args.backends:
+            outcome = run_isolated(model, backend, args.batch_sizes, args.fixture, args.allow_download)
+            if outcome is not None:
+                results.extend(outcome[0])
+                environment = outcome[1]
+
+    if not results:
+        print("❌ No configuration could be benchmarked.")
+        sys.exit(1)
+    print_table(results)
+
+    report = {
+        "created_at": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+        "fixture": os.path.relpath(args.fixture, REPO_ROOT),
+        "fixture_sha256": fixture_sha256,
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        **environment,
+        "results": results,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"✅ Results written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        if baseline.get("fixture_sha256") != fixture_sha256:
+            print("⚠️ The baseline was measured on a different fixture; ROUGE is not comparable.")
+        regressions = find_regressions(results, baseline, args.tolerance)
+        for regression in regressions:
+            print(f"❌ {regression}")
+        if regressions:
+            sys.exit(1)
+        print(f"✅ No regressions against {args.baseline}")
+
+
+if __name__ == "__main__":
+    main()
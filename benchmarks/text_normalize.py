@@ -0,0 +1,69 @@
+# Micro-benchmark of text normalization against the old four-pass preprocess_text
+#
+#   python -m benchmarks.text_normalize --repeat 200
+
+import argparse
+import json
+import re
+import timeit
+
+from news.text_normalize import normalize_text, strip_for_model
+
+ENGLISH_PARAGRAPH = (
+    "Rescue teams in Mandalay&nbsp;said on Tuesday that at least 242 people were killed "
+    "when the 7.7-magnitude quake struck.\n\nThe town&#8217;s fire department &mdash; which "
+    "lost two stations &mdash; has asked for “urgent” help with food, water &amp; shelter.  "
+)
+BURMESE_PARAGRAPH = (
+    "မန္တလေးမြို့တွင်"
+    "\u200bငလျင်လှုပ်ခတ်ခဲ့"
+    "သည်။ ကယ်ဆယ်ရေးအဖွ"
+    "ဲ့များ&nbsp;ရောက်ရှိလာ"
+    "သည်။\n"
+)
+
+
+def legacy_preprocess_text(text):
+    """preprocess_text() before the shared normalization module."""
+    text = re.sub(r"\s+", " ", text.strip())
+    text = re.sub(r'\n+', ' ', text)
+    text = re.sub(r'&nbsp;', '', text)
+    text = re.sub(r"[^\w\s.,!?-]", "", text)
+    return text
+
+
+def run(name, fn, text, repeat):
+    seconds = min(timeit.repeat(lambda: fn(text), number=repeat, repeat=5)) / repeat
+    return {"case": name, "chars": len(text), "us_per_call": round(seconds * 1e6, 1),
+            "mb_per_s": round(len(text) / seconds / 1e6, 1)}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark text normalization")
+    parser.add_argument("--paragraphs", type=int, default=40, help="paragraphs per synthetic article")
+    parser.add_argument("--repeat", type=int, default=200, help="calls per timing run")
+    parser.add_argument("--json", help="also write the results to this file")
+    args = parser.parse_args()
+
+    english = ENGLISH_PARAGRAPH * args.paragraphs
+    burmese = BURMESE_PARAGRAPH * args.paragraphs
+    normalized_english = normalize_text(english)
+    results = [
+        run("legacy preprocess_text (en)", legacy_preprocess_text, english, args.repeat),
+        run("normalize_text (en, scrape time)", normalize_text, english, args.repeat),
+        run("strip_for_model (en, per summary)", strip_for_model, normalized_english, args.repeat),
+        run("normalize_text (my, scrape time)", normalize_text, burmese, args.repeat),
+    ]
+
+    print(f"{'case':<36}{'chars':>8}{'us/call':>10}{'MB/s':>8}")
+    for result in results:
+        print(f"{result['case']:<36}{result['chars']:>8}{result['us_per_call']:>10}{result['mb_per_s']:>8}")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"✅ Results written to {args.json}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,10 @@
 import streamlit as st
-import requests
 import pandas as pd
 from datetime import datetime
 from io import StringIO
 from utils.utils import scrolling_banner
+from utils.fetch_cache import get_json
+from utils.donations import get_donations_index
 
 # Configure page settings
 st.set_page_config(
@@ -103,8 +104,8 @@ st.markdown("""
 
 def fetch_data():
     try:
-        crisis = requests.get(f"{BACKEND_URL}/crisis-data").json()
-        donations = requests.get(f"{BACKEND_URL}/donations").json()
+        crisis = get_json("crisis-data", f"{BACKEND_URL}/crisis-data")
+        donations = get_donations_index(f"{BACKEND_URL}/donations")
         return crisis, donations
     except Exception as e:
         st.error(f"Connection error: {str(e)}")
@@ -178,14 +179,8 @@ def display_donations(donations):
 
     def create_tab_content(tab, category, btn_style, is_call=False, is_freebie=False):
         """Helper function to create tab content with filtering"""
-        filtered = [d for d in donations if d['category'].lower() == category]
-
-        # Get unique locations for this category
-        locations = sorted(
-            {loc for d in filtered for loc in d['locations'] if d['locations']})
-
-        # Add "All" option first
-        locations = ["All locations"] + locations
+        # Add "All" option first; the index keeps each category's locations sorted
+        locations = ["All locations"] + donations.locations(category)
 
         # Create dropdown
         selected_loc = tab.selectbox(
@@ -195,8 +190,7 @@ def display_donations(donations):
         )
 
         # Apply location filter
-        if selected_loc != "All locations":
-            filtered = [d for d in filtered if selected_loc in d['locations']]
+        filtered = donations.filter(category, None if selected_loc == "All locations" else selected_loc)
 
         # Display cards
         for link in filtered:
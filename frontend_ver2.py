@@ -1,6 +1,9 @@
 import streamlit as st
 import requests
 from utils.utils import scrolling_banner
+from utils.fetch_cache import cache_stats, get_json
+from utils.donations import get_donations_index
+from utils.geocoding import reverse_geocode_many
 from datetime import datetime
 import pandas as pd
 
@@ -78,7 +81,7 @@ hightlightText = """
 
 def fetch_data():
     try:
-        crisis = requests.get(f"{BACKEND_URL}/crisis-data").json()
+        crisis = get_json("crisis-data", f"{BACKEND_URL}/crisis-data")
         return crisis
     except Exception as e:
         st.error(f"Connection error: {str(e)}")
@@ -87,10 +90,7 @@ def fetch_data():
 
 def fetch_category_data(category):
     try:
-        response = requests.get(f"{BACKEND_URL}/donations")
-        response.raise_for_status()
-        all_data = response.json()
-        return [item for item in all_data if item['category'].lower() == category.lower()]
+        return get_donations_index(f"{BACKEND_URL}/donations").category(category)
     except requests.exceptions.RequestException as e:
         st.error(f"Error fetching data: {str(e)}")
         return []
@@ -118,10 +118,8 @@ def display_data_table(data, category):
                 # Name and Verification badge
                 st.markdown(f"#### {item['name']}")
 
-                # Locations with consistent colors
+                # Locations with consistent colors (split into a list by the donations index)
                 locations = item['locations']
-                if isinstance(locations, str):
-                    locations = [loc.strip() for loc in locations.split(",")]
 
                  # Single markdown call with multiple badges
                 badges = " ".join([
@@ -176,30 +174,55 @@ def show_category_page(category):
         st.warning("No resources found in this category")
 
 
-def fetch_news_data():
-    """Fetch summarized news articles from the backend."""
+NEWS_PAGE_SIZE = 10
+NEWS_FIELDS = "id,article_title,summary,url,published_at"
+NEWS_LANGUAGES = {"All": None, "English": "en", "မြန်မာ": "MM"}
+
+
+def fetch_news_page(cursor=None, language=None):
+    """Fetch one page of summarized news from the backend's paginated /news feed.
+
+    Returns:
+        tuple: (articles, next cursor or None); articles is None if the request failed
+    """
+    params = {"limit": NEWS_PAGE_SIZE, "fields": NEWS_FIELDS, "summarized": 1}
+    if cursor:
+        params["cursor"] = cursor
+    if language:
+        params["language"] = language
     try:
         # <-- your FastAPI endpoint
-        resp = requests.get(f"{LOCAL_BACKEND_URL}/news")
-        resp.raise_for_status()
-        return resp.json()
+        page = get_json("news", f"{LOCAL_BACKEND_URL}/news", params)
     except requests.exceptions.RequestException as e:
         st.error(f"Error fetching news: {e}")
-        return []
+        return None, None
+    if isinstance(page, list):  # Backend without pagination
+        return page, None
+    return page["items"], page["next_cursor"]
 
 
 def show_news_page():
     # back‐to‐main button
     if st.button("← Back to Main Page"):
         st.session_state.page = 'main'
+        st.session_state.pop("news_language", None)  # Start from the newest page next time
         st.rerun()
 
     st.title("News Summaries")
+    language = NEWS_LANGUAGES[st.radio("Language", list(NEWS_LANGUAGES), horizontal=True)]
     st.markdown("---")
 
-    with st.spinner("Loading latest news..."):
-        articles = fetch_news_data()
-
+    # Pages loaded so far live in the session; only the first is fetched up front
+    if st.session_state.get("news_language", "unset") != language:
+        with st.spinner("Loading latest news..."):
+            articles, cursor = fetch_news_page(language=language)
+        if articles is None:
+            return  # Not kept in the session, so the next rerun tries again
+        st.session_state.news_language = language
+        st.session_state.news_articles = articles
+        st.session_state.news_cursor = cursor
+
+    articles = st.session_state.news_articles
     if not articles:
         st.warning("No news available right now.")
         return
@@ -207,14 +230,25 @@ def show_news_page():
     for art in articles:
         # You can tweak which fields you display
         st.subheader(art['article_title'])
-        st.write(art['summary'])
+        if art.get('summary'):
+            st.write(art['summary'])
+        else:
+            st.caption("Summary not available yet.")
         st.markdown(f"[Read more]({art['url']})")
         st.divider()
 
+    if st.session_state.news_cursor and st.button("Load more", use_container_width=True):
+        with st.spinner("Loading more news..."):
+            more, cursor = fetch_news_page(st.session_state.news_cursor, language)
+        if more is None:
+            return
+        st.session_state.news_articles = articles + more
+        st.session_state.news_cursor = cursor
+        st.rerun()
+
 # 1) Earthquake data loader
 
 
-# @st.cache_data(ttl=60)
 def get_earthquake_data():
     url = "https://www.seismicportal.eu/fdsnws/event/1/query"
     params = {
@@ -226,26 +260,11 @@ def get_earthquake_data():
         "orderby": "time",
         "limit": 50
     }
-    resp = requests.get(url, params=params)
-    features = resp.json().get("features", [])
+    features = get_json("earthquakes", url, params).get("features", [])
     myanmar = [f for f in features if f["properties"]
                ["flynn_region"] == "MYANMAR"]
     return myanmar[:20]
 
-# 2) Reverse geocoding
-
-
-# @st.cache_data(ttl=24*3600)
-def get_place(lat, lon):
-    url = "https://nominatim.openstreetmap.org/reverse"
-    params = {"format": "json", "lat": lat, "lon": lon, "zoom": 10}
-    headers = {"User-Agent": "streamlit-earthquakes-app"}
-    r = requests.get(url, params=params, headers=headers)
-    if r.status_code == 200:
-        return r.json().get("display_name", "Unknown")
-    return "Unknown"
-
-
 def show_earthquake_page():
     if st.button("← Back to Main Page"):
         st.session_state.page = 'main'
@@ -259,18 +278,15 @@ def show_earthquake_page():
         st.warning("No recent earthquake events found in Myanmar.")
         return
 
-    # 2) prepare progress UI
-    total = len(events)
-    progress_bar = st.progress(0)
-    status_text = st.empty()
+    # 2) reverse geocode all events at once: cached names, concurrent lookups
+    #    for misses, and the offline gazetteer for anything still pending
+    properties = [e["properties"] for e in events]
+    with st.spinner("getting earthquake locations…"):
+        places = reverse_geocode_many([(p["lat"], p["lon"]) for p in properties])
 
-    # 3) build rows with inline geocoding + progress updates
+    # 3) build rows
     rows = []
-    for i, e in enumerate(events, start=1):
-        pct = (i / total) * 100
-        status_text.text(f"getting earthquake data ({pct:.0f}%)…")
-        p = e["properties"]
-        place = get_place(p["lat"], p["lon"])
+    for p, place in zip(properties, places):
         rows.append({
             "time_iso": p["time"],
             "မက်ဂနီကျု့": p["mag"],
@@ -279,13 +295,8 @@ def show_earthquake_page():
             "lon": p["lon"],
             "ဒေသ": place
         })
-        progress_bar.progress(i / total)
-
-    # 4) clean up UI
-    progress_bar.empty()
-    status_text.empty()
 
-    # 5) convert to DataFrame and render
+    # 4) convert to DataFrame and render
     df = pd.DataFrame(rows)
     df["နေ့စွဲ"] = pd.to_datetime(df["time_iso"]).dt.date
     df["အချိန်"] = pd.to_datetime(df["time_iso"]).dt.time
@@ -294,7 +305,7 @@ def show_earthquake_page():
     st.dataframe(df[["နေ့စွဲ", "အချိန်", "မက်ဂနီကျု့", "ဒေသ"]],
                  hide_index=True)
 
-    # 6) map
+    # 5) map
     df["marker_size"] = df["မက်ဂနီကျု့"].apply(lambda x: 6 ** x)
     st.subheader("🗺️ Map")
     st.map(
@@ -359,7 +370,20 @@ def main_page(crisis_data):
         st.rerun()
 
 
+def show_cache_debug_panel():
+    """Fetch cache hit/miss and latency table, shown with ?debug=1 in the URL."""
+    with st.sidebar.expander("🛠️ Fetch cache", expanded=True):
+        stats = cache_stats()
+        if stats:
+            st.dataframe(pd.DataFrame(stats), hide_index=True)
+        else:
+            st.caption("No fetches yet.")
+
+
 # Main app logic
+if st.query_params.get("debug") == "1":
+    show_cache_debug_panel()
+
 if st.session_state.page == 'main':
     main_page(hightlightText)
 elif st.session_state.page == 'news':
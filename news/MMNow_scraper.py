@@ -1,169 +1,83 @@
 # Scrape articles from Myanmar Now and save them to PostgresSQL
-import psycopg2
-import requests
+import argparse
 import json
-from bs4 import BeautifulSoup
-from news.db_connection import get_db_connection, create_news_table
+from news.article_store import fetch_known_urls, save_articles
+from news.config import SCRAPER_CONFIG
+from news.db_connection import create_news_table, db_connection
+from news.fetcher import fetch_concurrently
+from news.http_cache import get_http_cache
+from news.listing import ListingArticle, fetch_soup, scrape_listing
 
 MMNOW_URL = "https://myanmar-now.org/en/news/category/news/"
 NEWS_SOURCE = "Myanmar Now"
 
-def scrape_article_titles(url):
-    url = url
-    response = requests.get(url)
-    response.raise_for_status()
-    html_content = response.text
-    soup = BeautifulSoup(html_content, 'html.parser')
+def parse_listing(soup):
+    """Extract article records from an English category page."""
     latest_news = soup.find_all('div', class_="post-details")
-    article_titles = []
-    for article in latest_news:
-        h2_tag = article.find('h2', class_ = "post-title")
-        article_title = h2_tag.text
-        article_titles.append(article_title)
-    return article_titles
-
-
-def scrape_article_urls(url):
-    url = url
-    response = requests.get(url)
-    response.raise_for_status()
-    html_content = response.text
-    soup = BeautifulSoup(html_content, 'html.parser')
-    latest_news = soup.find_all('div', class_="post-details")
-    articles_to_urls = {}
-    for article in latest_news:
-        h2_tag = article.find('h2', class_="post-title")
-        article_title = h2_tag.text
-        article_url = h2_tag.find('a')['href']
-        articles_to_urls[article_title] = article_url
-    return articles_to_urls
-
-
-def scrape_article_excerpts(url):
-    url = url
-    response = requests.get(url)
-    response.raise_for_status()
-    html_content = response.text
-    soup = BeautifulSoup(html_content, 'html.parser')
-    latest_news = soup.find_all('div', class_="post-details")
-    articles_to_excerpts = {}
+    articles = []
     for article in latest_news:
         h2_tag = article.find('h2', class_="post-title")
-        article_title = h2_tag.text
-        excerpt = article.find('p', class_="post-excerpt").text
-        articles_to_excerpts[article_title] = excerpt
-    return articles_to_excerpts
-
-
-def scrape_article_timestamps(url):
-    url = url
-    response = requests.get(url)
-    response.raise_for_status()
-    html_content = response.text
-    soup = BeautifulSoup(html_content, 'html.parser')
-    latest_news = soup.find_all('div', class_="post-details")
-    articles_to_timestamps = {}
-    for article in latest_news:
-        h2_tag = article.find('h2', class_="post-title")
-        article_title = h2_tag.text
-        timestamp = article.find('span', class_='date meta-item tie-icon').text
-        articles_to_timestamps[article_title] = timestamp
-    return articles_to_timestamps
-
-
-def scrape_article_text(url):
-    url = url
-    response = requests.get(url)
-    response.raise_for_status()
-    html_content = response.text
-    soup = BeautifulSoup(html_content, 'html.parser')
-    latest_news = soup.find_all('div', class_="post-details")
-
-    articles_to_text = {}
-
-    for article in latest_news:
-        h2_tag = article.find('h2', class_="post-title")
-        article_title = h2_tag.text
-        article_link = h2_tag.find('a')['href']
-
-        # Fetch the article page
-        article_response = requests.get(article_link)
-        article_soup = BeautifulSoup(article_response.content, 'html.parser')
-        script_tag = article_soup.find("script", id="tie-schema-json", type='application/ld+json')
-        json_data = json.loads(script_tag.string)
-        article_body = json_data.get('articleBody', 'No text available')
-
-        # Store the HTML content
-        articles_to_text[article_title] = article_body
-
-    return articles_to_text
-
-
-# Insert data into the table
-def save_article(conn, news_source, title, excerpt, text, url, timestamp):
-    try:
-        with conn.cursor() as cur:
-            # Check if article with the same URL already exists
-            cur.execute("""
-            SELECT url, excerpt, timestamp, text
-            FROM news_articles
-            WHERE url = %s
-            """, (url,))
-            result = cur.fetchone()  # Fetch one row from the results
-            # If there’s no existing article with that title, `result` will be `None`.
-
-            if result:
-                # Unpack the `result` tuple into four variables to compare them with the new scraped data
-                existing_url, existing_excerpt, existing_timestamp, existing_text = result
-                if (existing_url == url and
-                existing_excerpt == excerpt and
-                existing_timestamp == timestamp and
-                existing_text == text):
-                    print("The scraped data already exists in the news_articles table in the database.")
-                    return
-
-            # If not the same (or no row exists), insert the new data
-            cur.execute("""
-                INSERT INTO news_articles (news_source, article_title, excerpt, text, url, timestamp)
-                VALUES (%s, %s, %s, %s, %s, %s)
-            """, (news_source, title, excerpt, text, url, timestamp))
-
-            conn.commit()  # Commit the transaction
-
-    except psycopg2.IntegrityError as e:
-        conn.rollback()
-        print(f"❌ Integrity error for {url}: {e}")
-
-    except Exception as e:
-        conn.rollback()
-        print(f"❌ Failed to process {url}: {e}")
-
-
-def main():
+        excerpt_tag = article.find('p', class_="post-excerpt")
+        date_tag = article.find('span', class_='date meta-item tie-icon')
+        articles.append(ListingArticle(
+            title=h2_tag.text,
+            url=h2_tag.find('a')['href'],
+            excerpt=excerpt_tag.text if excerpt_tag else "",
+            timestamp=date_tag.text if date_tag else None,
+        ))
+    return articles
+
+
+def scrape_article_text(article_url):
+    # Fetch the article page
+    article_soup = fetch_soup(article_url)
+    script_tag = article_soup.find("script", id="tie-schema-json", type='application/ld+json')
+    json_data = json.loads(script_tag.string)
+    return json_data.get('articleBody', 'No text available')
+
+
+def main(incremental=True):
+    """Scrape the English category page and save its articles.
+
+    Args:
+        incremental (bool): Only download bodies for articles whose URL is not stored yet
+    """
     create_news_table()
 
-    conn = get_db_connection()  # Database connection object
-    news_source = NEWS_SOURCE
-    url = MMNOW_URL
+    with db_connection() as conn:  # Pooled database connection
+        news_source = NEWS_SOURCE
+        url = MMNOW_URL
 
-    titles_to_excerpts = scrape_article_excerpts(url)
-    titles_to_text = scrape_article_text(url)
-    titles_to_urls = scrape_article_urls(url)
-    titles_to_timestamps = scrape_article_timestamps(url)
+        articles = {article.url: article for article in scrape_listing(url, parse_listing)}
+        if incremental:
+            known_urls = fetch_known_urls(conn, articles)
+            articles = {url: article for url, article in articles.items() if url not in known_urls}
 
-    for title in scrape_article_titles(url):
-        try:
-            excerpt = titles_to_excerpts.get(title)
-            text = titles_to_text.get(title)
-            url = titles_to_urls.get(title)
-            timestamp = titles_to_timestamps.get(title)
-            save_article(conn, news_source, title, excerpt, text, url, timestamp)
-        except Exception as e:
-            print(f"Failed to process {url}: {e}")
+        # Article bodies are downloaded concurrently and saved in batches as they arrive
+        batch = []
+        for article_url, text, error in fetch_concurrently(articles, scrape_article_text):
+            if error:
+                print(f"Failed to process {article_url}: {error}")
+                continue
+            article = articles[article_url]
+            batch.append((news_source, article.title, article.excerpt, text, article.url, article.timestamp, None))
+            if len(batch) >= SCRAPER_CONFIG['save_batch_size']:
+                save_articles(conn, batch)
+                batch = []
+        save_articles(conn, batch)
 
-    conn.close()  # Close the connection
+    cache_stats = get_http_cache().stats()
+    print(f"HTTP cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Scrape English Myanmar Now news into PostgreSQL")
+    parser.add_argument("--full", action="store_true",
+                        help="re-fetch every article instead of only unseen ones")
+    parser.add_argument("--no-cache", action="store_true",
+                        help="bypass the on-disk HTTP cache and download every page in full")
+    args = parser.parse_args()
+    if args.no_cache:
+        get_http_cache().bypass = True
+    main(incremental=not args.full)
 
@@ -0,0 +1,171 @@
+# Queries over the news_articles table shared by the scrapers and the summarizer
+
+import hashlib
+from datetime import datetime, timezone
+
+import psycopg2
+from psycopg2.extras import execute_values
+from news.dates import parse_published_at
+from news.text_normalize import normalize_text
+
+# Channel the scrapers NOTIFY after saving articles that need a summary
+SUMMARY_QUEUE_CHANNEL = "news_articles_pending"
+# Channel the summarizer NOTIFYs after writing summaries; together with the
+# one above it tells the backend that feed pages have changed
+SUMMARY_SAVED_CHANNEL = "news_articles_summarized"
+
+# Placeholder older summarizer versions stored when generation failed; never reused
+SUMMARY_FAILED = "Summary generation failed."
+
+ARTICLE_COLUMNS = ("news_source", "article_title", "excerpt", "text", "url", "timestamp", "language")
+
+# Rows whose content hash is unchanged are left alone; changed rows are
+# updated in place and lose their summary so it gets regenerated. published_at
+# keeps the value from the first time the article was seen.
+UPSERT_ARTICLES_QUERY = f"""
+    INSERT INTO news_articles ({", ".join(ARTICLE_COLUMNS)}, content_hash, published_at)
+    VALUES %s
+    ON CONFLICT (url) DO UPDATE SET
+        news_source = EXCLUDED.news_source,
+        article_title = EXCLUDED.article_title,
+        excerpt = EXCLUDED.excerpt,
+        text = EXCLUDED.text,
+        timestamp = EXCLUDED.timestamp,
+        language = EXCLUDED.language,
+        content_hash = EXCLUDED.content_hash,
+        summary = NULL,
+        summary_kind = NULL,
+        upgrade_pending = false,
+        summary_failed_at = NULL
+    WHERE news_articles.content_hash IS DISTINCT FROM EXCLUDED.content_hash
+    RETURNING id
+"""
+
+
+def content_hash(title, excerpt, text):
+    """SHA-256 over whitespace-normalized title, excerpt and text."""
+    normalized = "\x1f".join(" ".join((part or "").split()) for part in (title, excerpt, text))
+    return hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+
+
+def fetch_known_urls(conn, urls):
+    """Return the subset of urls already stored in news_articles, in one query."""
+    urls = list(urls)
+    if not urls:
+        return set()
+    with conn.cursor() as cur:
+        cur.execute("SELECT url FROM news_articles WHERE url = ANY(%s)", (urls,))
+        return {row[0] for row in cur.fetchall()}
+
+
+def upsert_articles(conn, rows, page_size=100):
+    """Insert new articles and update changed ones in one batch and one commit.
+
+    Args:
+        conn: psycopg2 connection
+        rows (list[tuple]): Values in ARTICLE_COLUMNS order
+        page_size (int): Rows per INSERT statement sent to the server
+
+    Returns:
+        int: Number of rows inserted or updated
+    """
+    # ON CONFLICT cannot touch the same row twice in one statement, so keep
+    # only the last version of each URL.
+    url_index = ARTICLE_COLUMNS.index("url")
+    rows = list({row[url_index]: row for row in rows}.values())
+    if not rows:
+        return 0
+    now = datetime.now(timezone.utc)
+    timestamp_index = ARTICLE_COLUMNS.index("timestamp")
+    # Normalize title, excerpt and text once here so readers never have to
+    rows = [(row[0], *map(normalize_text, row[1:4]), *row[4:]) for row in rows]
+    rows = [row + (content_hash(row[1], row[2], row[3]),
+                   parse_published_at(row[timestamp_index], now) or now)
+            for row in rows]
+
+    with conn.cursor() as cur:
+        written = execute_values(cur, UPSERT_ARTICLES_QUERY, rows, page_size=page_size, fetch=True)
+        if written:
+            # Delivered on commit; wakes any idle summary worker
+            cur.execute("SELECT pg_notify(%s, %s)", (SUMMARY_QUEUE_CHANNEL, str(len(written))))
+    conn.commit()
+    return len(written)
+
+
+def save_articles(conn, rows):
+    """Upsert a batch of scraped articles, reporting instead of raising on failure."""
+    if not rows:
+        return
+    try:
+        written = upsert_articles(conn, rows)
+        print(f"✅ Saved {written} new or changed articles out of {len(rows)} scraped.")
+    except psycopg2.Error as e:
+        conn.rollback()
+        print(f"❌ Failed to save a batch of {len(rows)} articles: {e}")
+
+
+def fetch_summaries_by_hash(conn, hashes):
+    """Map content hashes to (summary, summary_kind) of an article with that hash.
+
+    Provisional surge summaries are not reused, and abstractive ones win.
+    """
+    hashes = [h for h in set(hashes) if h]
+    if not hashes:
+        return {}
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT DISTINCT ON (content_hash) content_hash, summary, summary_kind
+            FROM news_articles
+            WHERE content_hash = ANY(%s) AND summary IS NOT NULL AND summary <> %s AND NOT upgrade_pending
+            ORDER BY content_hash, summary_kind = 'abstractive' DESC
+        """, (hashes, SUMMARY_FAILED))
+        return {content_hash: (summary, kind) for content_hash, summary, kind in cur.fetchall()}
+
+
+def save_summaries(conn, summaries, page_size=500):
+    """Write [(article_id, summary, summary_kind, upgrade_pending), ...] back in one UPDATE per page.
+
+    Entries whose summary is None (generation failed) keep their current
+    summary and are stamped with summary_failed_at, so the queue retries
+    them after SUMMARIZER_CONFIG['retry_delay'] instead of at once.
+
+    Returns:
+        int: Number of summaries written
+    """
+    written = [entry for entry in summaries if entry[1] is not None]
+    failed = [entry[0] for entry in summaries if entry[1] is None]
+    with conn.cursor() as cur:
+        if written:
+            execute_values(cur, """
+                UPDATE news_articles AS a
+                SET summary = v.summary, summary_kind = v.summary_kind, upgrade_pending = v.upgrade_pending,
+                    summary_failed_at = NULL
+                FROM (VALUES %s) AS v (id, summary, summary_kind, upgrade_pending)
+                WHERE a.id = v.id
+            """, written, page_size=page_size)
+            # Delivered when the caller commits
+            cur.execute("SELECT pg_notify(%s, %s)", (SUMMARY_SAVED_CHANNEL, str(len(written))))
+        if failed:
+            cur.execute("UPDATE news_articles SET summary_failed_at = now() WHERE id = ANY(%s)", (failed,))
+    return len(written)
+
+
+def backfill_content_hashes(conn, page_size=500, commit=True):
+    """Compute content_hash for rows stored before the column existed."""
+    with conn.cursor() as cur:
+        cur.execute("""
+            SELECT id, article_title, excerpt, text
+            FROM news_articles
+            WHERE content_hash IS NULL
+        """)
+        rows = [(content_hash(title, excerpt, text), article_id)
+                for article_id, title, excerpt, text in cur.fetchall()]
+        if rows:
+            execute_values(cur, """
+                UPDATE news_articles AS a SET content_hash = v.content_hash
+                FROM (VALUES %s) AS v (content_hash, id)
+                WHERE a.id = v.id
+            """, rows, page_size=page_size)
+    if commit:
+        conn.commit()
+    return len(rows)
@@ -0,0 +1,42 @@
+# Myanmar-script detection and Zawgyi conversion
+
+import re
+
+MYANMAR_CHAR_RE = re.compile("[\u1000-\u109f\uaa60-\uaa7f\ua9e0-\ua9ff]")
+LATIN_CHAR_RE = re.compile(r"[A-Za-z]")
+
+# Zawgyi encodes visual order, so these sequences are invalid or very rare in Unicode:
+#   - vowel sign E (U+1031) not following a consonant or medial
+#   - U+103B (Unicode medial YA, Zawgyi medial RA) written before its consonant
+#   - the U+105A / U+1060-U+1097 glyph variants Zawgyi uses for stacked letters
+_CONSONANT = "\u1000-\u1021\u1023-\u1027\u1029\u102a\u103f\u104e"
+_MEDIAL = "\u103b-\u103e"
+ZAWGYI_MARKER_RE = re.compile(
+    f"(?<![{_CONSONANT}{_MEDIAL}\u1039\u200c])\u1031"
+    f"|(?<![{_CONSONANT}\u1039])\u103b(?=[{_CONSONANT}])"
+    "|[\u105a\u1060-\u1097]"
+)
+
+
+def detect_script(text, sample_chars=2000):
+    """Classify text as "latin", "myanmar-unicode" or "myanmar-zawgyi".
+
+    Only the first sample_chars characters are inspected, so this is cheap
+    enough to run on every row before choosing a model.
+    """
+    sample = text[:sample_chars]
+    myanmar = len(MYANMAR_CHAR_RE.findall(sample))
+    if myanmar == 0 or myanmar < len(LATIN_CHAR_RE.findall(sample)):
+        return "latin"
+    markers = len(ZAWGYI_MARKER_RE.findall(sample))
+    return "myanmar-zawgyi" if markers >= 2 and markers / myanmar > 0.01 else "myanmar-unicode"
+
+
+def zawgyi_to_unicode(text):
+    """Convert Zawgyi text to Unicode with ICU, or return None if PyICU is not installed."""
+    try:
+        from icu import Transliterator
+    except ImportError:
+        return None
+    return Transliterator.createInstance("Zawgyi-my").transliterate(text)
+
@@ -12,4 +12,45 @@ DB_CONFIG = {
     'password': os.getenv('DB_PASSWORD'),
     'host': os.getenv('DB_HOST', 'localhost'),
     'port': os.getenv('DB_PORT', 5432)
-}
\ No newline at end of file
+}
+
+# Scraper fetch settings
+SCRAPER_CONFIG = {
+    'max_workers': int(os.getenv('SCRAPER_MAX_WORKERS', 8)),  # Concurrent article downloads
+    'host_delay': float(os.getenv('SCRAPER_HOST_DELAY', 0.25)),  # Seconds between requests to one host
+    'retries': int(os.getenv('SCRAPER_RETRIES', 3)),
+    'backoff': float(os.getenv('SCRAPER_BACKOFF', 1.0)),  # Base seconds for exponential backoff
+    'save_batch_size': int(os.getenv('SCRAPER_SAVE_BATCH_SIZE', 50)),  # Articles per upsert/commit
+}
+
+# On-disk HTTP cache for listing and article pages
+HTTP_CACHE_CONFIG = {
+    'path': os.getenv('HTTP_CACHE_PATH', os.path.join('.cache', 'http_cache.sqlite3')),
+    'max_bytes': int(os.getenv('HTTP_CACHE_MAX_BYTES', 200 * 1024 * 1024)),  # Compressed body budget
+    'bypass': os.getenv('HTTP_CACHE_BYPASS', '').lower() in ('1', 'true', 'yes'),
+}
+
+SUMMARY_CACHE_CONFIG = {
+    'path': os.getenv('SUMMARY_CACHE_PATH', os.path.join('.cache', 'summary_cache.sqlite3')),
+    'max_bytes': int(os.getenv('SUMMARY_CACHE_MAX_BYTES', 64 * 1024 * 1024)),  # Summary text budget
+    'bypass': os.getenv('SUMMARY_CACHE_BYPASS', '').lower() in ('1', 'true', 'yes'),
+}
+
+# Connection pool sizing shared by the scrapers, summarizer and API
+DB_POOL_CONFIG = {
+    'minconn': int(os.getenv('DB_POOL_MIN', 1)),
+    'maxconn': int(os.getenv('DB_POOL_MAX', 10)),
+    'health_check': os.getenv('DB_POOL_HEALTH_CHECK', 'true').lower() in ('1', 'true', 'yes'),
+}
+
+# Summarizer settings
+SUMMARIZER_CONFIG = {
+    'batch_size': int(os.getenv('SUMMARIZER_BATCH_SIZE', 8)),  # Articles per generate() call
+    'backend': os.getenv('SUMMARIZER_BACKEND', 'torch'),  # torch, torch-int8 or onnx
+    # Model for language = 'MM' rows, e.g. csebuetnlp/mT5_multilingual_XLSum; unset uses an extractive summary
+    'burmese_model': os.getenv('SUMMARIZER_BURMESE_MODEL') or None,
+    'worker_idle_timeout': float(os.getenv('SUMMARIZER_WORKER_IDLE_TIMEOUT', 300)),  # Backlog check without NOTIFY
+    # Backlog size above which the worker first fills it with extractive summaries
+    'surge_threshold': int(os.getenv('SUMMARIZER_SURGE_THRESHOLD', 200)),
+    'retry_delay': float(os.getenv('SUMMARIZER_RETRY_DELAY', 600)),  # Seconds before a failed row is claimed again
+}
@@ -0,0 +1,82 @@
+# Parse the date labels shown on Myanmar Now listing pages
+
+import re
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+
+MYANMAR_TZ = ZoneInfo("Asia/Yangon")
+
+BURMESE_DIGITS = str.maketrans("၀၁၂၃၄၅၆၇၈၉", "0123456789")
+
+BURMESE_MONTHS = {
+    "ဇန်နဝါရီ": "January",
+    "ဖေဖော်ဝါရီ": "February",
+    "မတ်": "March",
+    "ဧပြီ": "April",
+    "မေ": "May",
+    "ဇွန်": "June",
+    "ဇူလိုင်": "July",
+    "သြဂုတ်": "August",
+    "ဩဂုတ်": "August",
+    "စက်တင်ဘာ": "September",
+    "အောက်တိုဘာ": "October",
+    "နိုဝင်ဘာ": "November",
+    "ဒီဇင်ဘာ": "December",
+}
+# Longest names first; an optional trailing "လ" (month) is dropped with the name
+_BURMESE_MONTH_RE = re.compile(
+    "(" + "|".join(sorted(BURMESE_MONTHS, key=len, reverse=True)) + ")လ?"
+)
+
+RELATIVE_UNITS = {
+    "second": timedelta(seconds=1), "sec": timedelta(seconds=1), "စက္ကန့်": timedelta(seconds=1),
+    "minute": timedelta(minutes=1), "min": timedelta(minutes=1), "မိနစ်": timedelta(minutes=1),
+    "hour": timedelta(hours=1), "နာရီ": timedelta(hours=1),
+    "day": timedelta(days=1), "ရက်": timedelta(days=1),
+    "week": timedelta(weeks=1), "ပတ်": timedelta(weeks=1),
+    "month": timedelta(days=30), "လ": timedelta(days=30),
+    "year": timedelta(days=365), "နှစ်": timedelta(days=365),
+}
+_RELATIVE_RE = re.compile(r"^(\d+)\s*([A-Za-z]+|[က-႟]+)")
+
+ABSOLUTE_FORMATS = (
+    "%B %d, %Y", "%b %d, %Y", "%d %B %Y", "%d %b %Y", "%d %B, %Y",
+    "%Y-%m-%d %H:%M:%S.%f", "%Y-%m-%d %H:%M:%S", "%Y-%m-%d",
+)
+
+
+def parse_published_at(label, now=None):
+    """Turn a listing date label into an aware datetime.
+
+    Handles relative labels ("2 days ago", "၂ ရက်") and absolute dates in
+    English or Burmese, with Burmese digits. Absolute dates without a time
+    are taken as midnight in Myanmar time.
+
+    Args:
+        label (str): Raw label scraped from the page
+        now (datetime): Reference time for relative labels, defaults to now (UTC)
+
+    Returns:
+        datetime | None: Publication time, or None if the label is not understood
+    """
+    if not label:
+        return None
+    text = label.translate(BURMESE_DIGITS)
+    text = _BURMESE_MONTH_RE.sub(lambda m: f" {BURMESE_MONTHS[m.group(1)]} ", text)
+    text = " ".join(text.replace("၊", ",").replace("။", "").split())
+
+    match = _RELATIVE_RE.match(text)
+    if match:
+        unit = match.group(2).lower().rstrip("s")
+        delta = RELATIVE_UNITS.get(unit)
+        if delta is not None:
+            now = now or datetime.now(timezone.utc)
+            return now - int(match.group(1)) * delta
+
+    for fmt in ABSOLUTE_FORMATS:
+        try:
+            parsed = datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+        return parsed.replace(tzinfo=MYANMAR_TZ)
+    return None
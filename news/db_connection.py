@@ -1,33 +1,102 @@
+import atexit
+import threading
+from contextlib import contextmanager
+
 import psycopg2
-from news.config import DB_CONFIG
+from psycopg2.pool import ThreadedConnectionPool
+from news.config import DB_CONFIG, DB_POOL_CONFIG
+from news.migrations import migrate
+
+_pool = None
+_pool_slots = None  # Makes callers wait for a free connection instead of raising PoolError
+_pool_lock = threading.Lock()
+
 
 def get_db_connection():
+    """Open a dedicated, unpooled connection. Prefer db_connection() in long-running code."""
     return psycopg2.connect(**DB_CONFIG)
 
-def create_news_table():
-    create_table_query = """
-    CREATE TABLE IF NOT EXISTS news_articles (
-        id SERIAL PRIMARY KEY,
-        news_source TEXT NOT NULL,
-        article_title TEXT NOT NULL,
-        excerpt TEXT NOT NULL,
-        text TEXT NOT NULL,
-        url TEXT UNIQUE NOT NULL,
-        timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-        summary TEXT
-        "language" TEXT
-    );
+
+def get_pool():
+    """Return the process-wide connection pool, creating it on first use."""
+    global _pool, _pool_slots
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool_slots = threading.BoundedSemaphore(DB_POOL_CONFIG['maxconn'])
+                _pool = ThreadedConnectionPool(DB_POOL_CONFIG['minconn'], DB_POOL_CONFIG['maxconn'], **DB_CONFIG)
+    return _pool
+
+
+def close_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.closeall()
+            _pool = None
+
+
+atexit.register(close_pool)
+
+
+def _is_healthy(conn):
+    if conn.closed:
+        return False
+    if not DB_POOL_CONFIG['health_check']:
+        return True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+        conn.rollback()
+        return True
+    except psycopg2.Error:
+        return False
+
+
+@contextmanager
+def db_connection():
+    """Borrow a healthy pooled connection.
+
+    The transaction is committed when the block exits normally and rolled
+    back if it raises; the connection then goes back to the pool.
     """
+    pool = get_pool()
+    _pool_slots.acquire()
     try:
-        conn = get_db_connection()
-        cursor = conn.cursor()
-        cursor.execute(create_table_query)
-        conn.commit()
-        cursor.close()
-        conn.close()
-        print("✅ news_articles table created successfully.")
+        conn = pool.getconn()
+        if not _is_healthy(conn):
+            pool.putconn(conn, close=True)
+            conn = pool.getconn()
+        try:
+            yield conn
+            conn.commit()
+        except Exception:
+            if not conn.closed:
+                conn.rollback()
+            raise
+        finally:
+            pool.putconn(conn, close=bool(conn.closed))
+    finally:
+        _pool_slots.release()
+
+
+@contextmanager
+def db_cursor():
+    """Shortcut for a cursor on a pooled connection, committed on success."""
+    with db_connection() as conn:
+        with conn.cursor() as cur:
+            yield cur
+
+
+def create_news_table():
+    """Create or upgrade news_articles by applying pending migrations."""
+    try:
+        with db_connection() as conn:
+            version = migrate(conn)
+        print(f"✅ news_articles schema is up to date (version {version}).")
     except Exception as e:
         print(f"❌ Error creating table: {e}")
 
+
 if __name__ == "__main__":
-    create_news_table()
\ No newline at end of file
+    create_news_table()
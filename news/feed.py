@@ -0,0 +1,137 @@
+# Paginated news feed: keyset pagination on (published_at, id) with filters and field projection
+#
+# Contract of GET /news:
+#   limit     page size, 1..MAX_LIMIT (default DEFAULT_LIMIT)
+#   cursor    opaque next_cursor of the previous page; omit for the first page
+#   language  "en" (stored as NULL) or "MM"
+#   source    news_source, e.g. "Myanmar Now"
+#   summarized  1 to leave out articles still waiting for a summary
+#   fields    comma-separated subset of FEED_FIELDS (default DEFAULT_FIELDS);
+#             the full article text is never part of the feed
+# Response: {"items": [{field: value, ...}, ...], "next_cursor": str or null}
+#
+# Every page is one index range scan (see migrations 4, 7 and 9), so the cost
+# of a page does not grow with the number of stored articles.
+#
+#   python -m news.feed --limit 5 --language MM
+
+import argparse
+import base64
+import json
+from datetime import datetime
+
+FEED_FIELDS = ("id", "news_source", "article_title", "excerpt", "summary", "summary_kind", "url",
+               "published_at", "language")
+DEFAULT_FIELDS = ("id", "news_source", "article_title", "summary", "url", "published_at", "language")
+DEFAULT_LIMIT = 20
+MAX_LIMIT = 100
+
+
+def encode_cursor(published_at, article_id):
+    raw = f"{published_at.isoformat()}|{article_id}".encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor):
+    """Return (published_at, id) from a cursor, raising ValueError if it is malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode("utf-8")
+        published_at, article_id = raw.rsplit("|", 1)
+        return datetime.fromisoformat(published_at), int(article_id)
+    except (ValueError, UnicodeDecodeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+
+
+def parse_fields(fields):
+    """Validate a comma-separated field list (or sequence) against FEED_FIELDS."""
+    if not fields:
+        return DEFAULT_FIELDS
+    if isinstance(fields, str):
+        fields = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in fields if field not in FEED_FIELDS]
+    if unknown:
+        raise ValueError(f"Unknown fields {', '.join(unknown)}; choose from {', '.join(FEED_FIELDS)}")
+    return tuple(dict.fromkeys(fields))
+
+
+def fetch_feed(conn, limit=DEFAULT_LIMIT, cursor=None, language=None, source=None, fields=None,
+               summarized=False):
+    """Fetch one page of the news feed, newest first.
+
+    Args:
+        conn: psycopg2 connection
+        limit (int): Page size, clamped to 1..MAX_LIMIT
+        cursor (str): next_cursor of the previous page
+        language (str): "en" or "MM"
+        source (str): news_source to filter on
+        fields (str | list[str]): Fields to return, see FEED_FIELDS
+        summarized (bool): Only return articles that already have a summary
+
+    Returns:
+        dict: {"items": [...], "next_cursor": str or None}
+
+    Raises:
+        ValueError: Malformed cursor or unknown field
+    """
+    limit = max(1, min(int(limit), MAX_LIMIT))
+    fields = parse_fields(fields)
+    # published_at and id are always read to build the next cursor
+    columns = list(dict.fromkeys((*fields, "published_at", "id")))
+
+    conditions, params = [], []
+    if language:
+        if language.lower() == "en":
+            conditions.append('"language" IS NULL')
+        else:
+            conditions.append('"language" = %s')
+            params.append(language)
+    if source:
+        conditions.append("news_source = %s")
+        params.append(source)
+    if summarized:
+        conditions.append("summary IS NOT NULL")
+    if cursor:
+        conditions.append("(published_at, id) < (%s, %s)")
+        params.extend(decode_cursor(cursor))
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+
+    with conn.cursor() as cur:
+        cur.execute(f"""
+            SELECT {", ".join(f'"{column}"' for column in columns)}
+            FROM news_articles
+            {where}
+            ORDER BY published_at DESC, id DESC
+            LIMIT %s
+        """, (*params, limit + 1))  # One extra row tells whether another page exists
+        rows = cur.fetchall()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = dict(zip(columns, rows[-1]))
+        next_cursor = encode_cursor(last["published_at"], last["id"])
+
+    items = []
+    for row in rows:
+        record = dict(zip(columns, row))
+        items.append({field: record[field].isoformat() if isinstance(record[field], datetime) else record[field]
+                      for field in fields})
+    return {"items": items, "next_cursor": next_cursor}
+
+
+if __name__ == "__main__":
+    from news.db_connection import db_connection
+
+    parser = argparse.ArgumentParser(description="Print one page of the news feed as JSON")
+    parser.add_argument("--limit", type=int, default=DEFAULT_LIMIT)
+    parser.add_argument("--cursor")
+    parser.add_argument("--language", help='"en" or "MM"')
+    parser.add_argument("--source")
+    parser.add_argument("--fields", help=f"comma-separated subset of {','.join(FEED_FIELDS)}")
+    parser.add_argument("--summarized", action="store_true", help="skip articles without a summary yet")
+    args = parser.parse_args()
+
+    with db_connection() as conn:
+        page = fetch_feed(conn, args.limit, args.cursor, args.language, args.source, args.fields,
+                          args.summarized)
+    print(json.dumps(page, ensure_ascii=False, indent=2))
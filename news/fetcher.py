@@ -0,0 +1,96 @@
+# Polite, retrying HTTP fetches and a bounded worker pool for article pages
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlsplit
+
+import requests
+from news.config import SCRAPER_CONFIG
+from news.http_cache import get_http_cache
+from utils.http_session import get_session
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class HostThrottle:
+    """Space out request start times per host by a fixed politeness delay."""
+
+    def __init__(self, delay):
+        self.delay = delay
+        self._lock = threading.Lock()
+        self._next_slot = {}  # host -> earliest monotonic time of the next request
+
+    def wait(self, url):
+        host = urlsplit(url).netloc
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot.get(host, now))
+            self._next_slot[host] = slot + self.delay
+        if slot > now:
+            time.sleep(slot - now)
+
+
+_throttle = HostThrottle(SCRAPER_CONFIG['host_delay'])
+
+
+def fetch(url, retries=None, backoff=None):
+    """GET a URL with per-host politeness and exponential backoff on transient errors.
+
+    Requests are revalidated against the on-disk HTTP cache, so an unchanged
+    page comes back as a 304 and is served from disk.
+
+    Args:
+        url (str): Page to download
+        retries (int): Extra attempts after the first one fails
+        backoff (float): Base delay in seconds, doubled after every failed attempt
+
+    Returns:
+        requests.Response: The successful response
+    """
+    retries = SCRAPER_CONFIG['retries'] if retries is None else retries
+    backoff = SCRAPER_CONFIG['backoff'] if backoff is None else backoff
+    cache = get_http_cache()
+
+    for attempt in range(retries + 1):
+        _throttle.wait(url)
+        try:
+            response = get_session().get(url, headers=cache.conditional_headers(url))
+            if response.status_code not in RETRY_STATUS_CODES:
+                response.raise_for_status()
+                response = cache.resolve(url, response)
+                if response.status_code == 304:
+                    # The entry was evicted after the validators were read
+                    response = cache.resolve(url, get_session().get(url))
+                    response.raise_for_status()
+                return response
+            error = requests.HTTPError(f"{response.status_code} for {url}", response=response)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            error = e
+
+        if attempt < retries:
+            time.sleep(backoff * 2 ** attempt)
+
+    raise error
+
+
+def fetch_concurrently(urls, fetch_fn, max_workers=None):
+    """Run fetch_fn over urls on a bounded thread pool, yielding results as they finish.
+
+    Args:
+        urls (iterable[str]): URLs to process
+        fetch_fn (callable): Called as fetch_fn(url) inside a worker thread
+        max_workers (int): Concurrency limit
+
+    Yields:
+        tuple: (url, result, error) where exactly one of result/error is set
+    """
+    max_workers = max_workers or SCRAPER_CONFIG['max_workers']
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(fetch_fn, url): url for url in urls}
+        for future in as_completed(futures):
+            url = futures[future]
+            try:
+                yield url, future.result(), None
+            except Exception as e:
+                yield url, None, e
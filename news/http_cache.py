@@ -0,0 +1,140 @@
+# Persistent HTTP cache with conditional GET revalidation for scraped pages
+
+import os
+import sqlite3
+import threading
+import time
+import zlib
+
+import requests
+from news.config import HTTP_CACHE_CONFIG
+
+
+class HttpCache:
+    """URL-keyed SQLite store of validators (ETag/Last-Modified) and zlib-compressed bodies.
+
+    Entries are evicted least-recently-used first once the compressed bodies
+    exceed max_bytes. hits counts 304 responses served from disk, misses counts
+    full downloads.
+    """
+
+    def __init__(self, path, max_bytes, bypass=False):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS responses (
+                url TEXT PRIMARY KEY,
+                etag TEXT,
+                last_modified TEXT,
+                encoding TEXT,
+                body BLOB NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_last_used ON responses (last_used)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def conditional_headers(self, url):
+        """Return If-None-Match/If-Modified-Since headers for a cached URL, if any."""
+        if self.bypass:
+            return {}
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT etag, last_modified FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+        if row is None:
+            return {}
+        etag, last_modified = row
+        headers = {}
+        if etag:
+            headers['If-None-Match'] = etag
+        if last_modified:
+            headers['If-Modified-Since'] = last_modified
+        return headers
+
+    def resolve(self, url, response):
+        """Turn a revalidation response into the page to use, updating the cache.
+
+        A 304 is answered from disk; a fresh 200 with validators is stored.
+        """
+        if response.status_code == 304 and not self.bypass:
+            cached = self._load(url)
+            if cached is not None:
+                self.hits += 1
+                return cached
+
+        self.misses += 1
+        if response.status_code == 200 and not self.bypass:
+            self._store(url, response)
+        return response
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'bytes': self._total_bytes}
+
+    def _load(self, url):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT encoding, body FROM responses WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute("UPDATE responses SET last_used = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+
+        encoding, body = row
+        cached = requests.Response()
+        cached.status_code = 200
+        cached.url = url
+        cached.encoding = encoding
+        cached._content = zlib.decompress(body)
+        return cached
+
+    def _store(self, url, response):
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return  # Nothing to revalidate with next time
+
+        body = zlib.compress(response.content, 6)
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._conn.execute("""
+                INSERT OR REPLACE INTO responses (url, etag, last_modified, encoding, body, size, last_used)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+            """, (url, etag, last_modified, response.encoding, body, len(body), time.time()))
+            self._total_bytes += len(body) - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        while self._total_bytes > self.max_bytes:
+            row = self._conn.execute(
+                "SELECT url, size FROM responses ORDER BY last_used LIMIT 1"
+            ).fetchone()
+            if row is None:
+                break
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+            self._total_bytes -= row[1]
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_http_cache():
+    """Return the process-wide cache configured from HTTP_CACHE_CONFIG."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = HttpCache(**HTTP_CACHE_CONFIG)
+    return _cache
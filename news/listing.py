@@ -0,0 +1,43 @@
+# Shared listing-page extraction for the Myanmar Now scrapers
+
+from dataclasses import dataclass
+from typing import Optional
+
+from bs4 import BeautifulSoup
+from news.fetcher import fetch
+
+
+@dataclass(frozen=True)
+class ListingArticle:
+    """One article teaser as it appears on a category listing page."""
+    title: str
+    url: str
+    excerpt: str
+    timestamp: Optional[str]
+
+
+def fetch_soup(url):
+    """Download a page once and parse it with BeautifulSoup."""
+    response = fetch(url)
+    return BeautifulSoup(response.content, 'html.parser')
+
+
+def scrape_listing(url, parse_listing):
+    """Fetch and parse a category page once, returning its article records.
+
+    Args:
+        url (str): Category (listing) page URL
+        parse_listing (callable): Site-specific parser taking the page soup and
+            returning a list of ListingArticle
+
+    Returns:
+        list[ListingArticle]: Articles in page order, de-duplicated by URL
+    """
+    articles = []
+    seen_urls = set()
+    for article in parse_listing(fetch_soup(url)):
+        if article.url in seen_urls:
+            continue
+        seen_urls.add(article.url)
+        articles.append(article)
+    return articles
@@ -0,0 +1,205 @@
+# Versioned schema migrations for the news_articles table
+
+from datetime import datetime, timezone
+
+from psycopg2.extras import execute_values
+from news.article_store import SUMMARY_FAILED, backfill_content_hashes, content_hash
+from news.dates import parse_published_at
+from news.text_normalize import normalize_text
+
+MIGRATION_LOCK_ID = 7_312_025  # pg_advisory_lock key so concurrent runs apply each step once
+
+
+def _create_news_articles(cur):
+    cur.execute("""
+        CREATE TABLE IF NOT EXISTS news_articles (
+            id SERIAL PRIMARY KEY,
+            news_source TEXT NOT NULL,
+            article_title TEXT NOT NULL,
+            excerpt TEXT NOT NULL,
+            text TEXT NOT NULL,
+            url TEXT UNIQUE NOT NULL,
+            timestamp TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            summary TEXT,
+            "language" TEXT
+        );
+        -- Tables created by hand before the missing-comma fix lack this column
+        ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS "language" TEXT;
+    """)
+
+
+def _add_content_hash(cur):
+    cur.execute("""
+        ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS content_hash TEXT;
+        CREATE INDEX IF NOT EXISTS news_articles_content_hash_idx ON news_articles (content_hash);
+    """)
+    backfill_content_hashes(cur.connection, commit=False)
+
+
+def _add_published_at(cur):
+    # "timestamp" receives raw listing labels such as "2 days ago", so keep it
+    # as text and store the parsed time in published_at.
+    cur.execute("""
+        ALTER TABLE news_articles ALTER COLUMN "timestamp" DROP DEFAULT;
+        ALTER TABLE news_articles ALTER COLUMN "timestamp" TYPE TEXT USING "timestamp"::text;
+        ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS published_at TIMESTAMPTZ;
+    """)
+
+    # Relative labels of existing rows can only be anchored to the migration time
+    now = datetime.now(timezone.utc)
+    cur.execute('SELECT id, "timestamp" FROM news_articles WHERE published_at IS NULL')
+    rows = [(parse_published_at(label, now) or now, article_id) for article_id, label in cur.fetchall()]
+    if rows:
+        execute_values(cur, """
+            UPDATE news_articles AS a SET published_at = v.published_at
+            FROM (VALUES %s) AS v (published_at, id)
+            WHERE a.id = v.id
+        """, rows, page_size=500)
+
+    cur.execute("""
+        ALTER TABLE news_articles ALTER COLUMN published_at SET DEFAULT now();
+        ALTER TABLE news_articles ALTER COLUMN published_at SET NOT NULL;
+    """)
+
+
+def _add_feed_indexes(cur):
+    cur.execute("""
+        -- Summarizer backlog scans: WHERE summary IS NULL
+        CREATE INDEX IF NOT EXISTS news_articles_summary_backlog_idx
+            ON news_articles (id) WHERE summary IS NULL;
+        -- Latest-N feed and keyset pagination on (published_at, id)
+        CREATE INDEX IF NOT EXISTS news_articles_published_idx
+            ON news_articles (published_at DESC, id DESC);
+        -- Feed filtered by language and/or source
+        CREATE INDEX IF NOT EXISTS news_articles_language_source_published_idx
+            ON news_articles ("language", news_source, published_at DESC, id DESC);
+        CREATE INDEX IF NOT EXISTS news_articles_source_published_idx
+            ON news_articles (news_source, published_at DESC, id DESC);
+    """)
+
+
+def _add_summary_kind(cur):
+    # summary_kind records how a summary was made; upgrade_pending marks
+    # extractive summaries written during a backlog surge that should be
+    # replaced by an abstractive one when there is capacity.
+    cur.execute("""
+        ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS summary_kind TEXT;
+        ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS upgrade_pending BOOLEAN NOT NULL DEFAULT false;
+        UPDATE news_articles SET summary_kind = 'abstractive'
+            WHERE summary IS NOT NULL AND summary_kind IS NULL;
+        CREATE INDEX IF NOT EXISTS news_articles_upgrade_pending_idx
+            ON news_articles (id) WHERE upgrade_pending;
+    """)
+
+
+def _normalize_stored_text(cur):
+    # Text is normalized on save from now on; bring older rows in line so the
+    # summarizer can skip normalization and re-scrapes keep the same hash.
+    cur.execute("SELECT id, article_title, excerpt, text FROM news_articles")
+    rows = []
+    for article_id, *parts in cur.fetchall():
+        normalized = [normalize_text(part) for part in parts]
+        if normalized != parts:
+            rows.append((article_id, *normalized, content_hash(*normalized)))
+    if rows:
+        execute_values(cur, """
+            UPDATE news_articles AS a
+            SET article_title = v.article_title, excerpt = v.excerpt, text = v.text, content_hash = v.content_hash
+            FROM (VALUES %s) AS v (id, article_title, excerpt, text, content_hash)
+            WHERE a.id = v.id
+        """, rows, page_size=500)
+
+
+def _add_language_feed_index(cur):
+    cur.execute("""
+        -- Feed filtered by language only (language IS NULL for English)
+        CREATE INDEX IF NOT EXISTS news_articles_language_published_idx
+            ON news_articles ("language", published_at DESC, id DESC);
+    """)
+
+
+def _add_summary_failed_at(cur):
+    # Failed generations used to be stored as a placeholder summary, which
+    # took the row out of the backlog for good; put those rows back instead.
+    cur.execute("""
+        ALTER TABLE news_articles ADD COLUMN IF NOT EXISTS summary_failed_at TIMESTAMPTZ;
+        UPDATE news_articles SET summary = NULL, summary_kind = NULL, upgrade_pending = false
+            WHERE summary = %s;
+    """, (SUMMARY_FAILED,))
+
+
+def _add_summarized_feed_indexes(cur):
+    cur.execute("""
+        -- Feed restricted to summarized articles (summarized=1), as the news page requests it
+        CREATE INDEX IF NOT EXISTS news_articles_summarized_published_idx
+            ON news_articles (published_at DESC, id DESC) WHERE summary IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS news_articles_summarized_language_published_idx
+            ON news_articles ("language", published_at DESC, id DESC) WHERE summary IS NOT NULL;
+        CREATE INDEX IF NOT EXISTS news_articles_summarized_source_published_idx
+            ON news_articles (news_source, published_at DESC, id DESC) WHERE summary IS NOT NULL;
+    """)
+
+
+# (version, description, step). Append new steps; never edit applied ones.
+MIGRATIONS = [
+    (1, "create news_articles with language column", _create_news_articles),
+    (2, "add content_hash for change detection", _add_content_hash),
+    (3, "store raw timestamp labels as text and add published_at", _add_published_at),
+    (4, "add backlog and feed indexes", _add_feed_indexes),
+    (5, "add summary_kind and upgrade_pending for the extractive tier", _add_summary_kind),
+    (6, "normalize stored title, excerpt and text", _normalize_stored_text),
+    (7, "add language-only feed index", _add_language_feed_index),
+    (8, "retry failed summaries instead of storing a placeholder", _add_summary_failed_at),
+    (9, "add partial feed indexes for summarized articles", _add_summarized_feed_indexes),
+]
+
+
+def migrate(conn):
+    """Apply pending migrations in order, each in its own transaction.
+
+    Returns:
+        int: Schema version after migrating
+    """
+    with conn.cursor() as cur:
+        cur.execute("SELECT pg_advisory_lock(%s)", (MIGRATION_LOCK_ID,))
+    try:
+        with conn.cursor() as cur:
+            cur.execute("""
+                CREATE TABLE IF NOT EXISTS schema_migrations (
+                    version INTEGER PRIMARY KEY,
+                    description TEXT NOT NULL,
+                    applied_at TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+            """)
+            cur.execute("SELECT version FROM schema_migrations")
+            applied = {row[0] for row in cur.fetchall()}
+        conn.commit()
+
+        for version, description, step in MIGRATIONS:
+            if version in applied:
+                continue
+            with conn.cursor() as cur:
+                step(cur)
+                cur.execute(
+                    "INSERT INTO schema_migrations (version, description) VALUES (%s, %s)",
+                    (version, description),
+                )
+            conn.commit()
+            print(f"✅ Applied migration {version}: {description}")
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        with conn.cursor() as cur:
+            cur.execute("SELECT pg_advisory_unlock(%s)", (MIGRATION_LOCK_ID,))
+        conn.commit()
+
+    return MIGRATIONS[-1][0]
+
+
+if __name__ == "__main__":
+    from news.db_connection import db_connection
+
+    with db_connection() as conn:
+        version = migrate(conn)
+    print(f"✅ news_articles schema is at version {version}.")
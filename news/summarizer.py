@@ -1,43 +1,87 @@
 # Summarize articles using distilbart-cnn-12-6
+#
+# torch, transformers and the extractive tier's scipy are imported only when
+# a summarizer is built, so importing this module (e.g. for preprocess_text)
+# stays cheap; benchmarks/import_time.py guards that.
+#
+#   python -m news.summarizer                 # summarize the backlog
+#   python -m news.summarizer preview         # print the latest summaries
+#   python -m news.summarizer warmup          # download, export and load the models
 
-import torch
+import argparse
+import hashlib
+import inspect
 import re
 import time
-from transformers import AutoTokenizer, AutoModelForSeq2SeqLM
-from news.db_connection import get_db_connection
+from news.article_store import fetch_summaries_by_hash, save_summaries
+from news.burmese import detect_script, zawgyi_to_unicode
+from news.config import SUMMARIZER_CONFIG
+from news.db_connection import db_connection, db_cursor
+from news.summary_cache import SummaryCache, cache_key, get_summary_cache
+from news.text_normalize import normalize_text, strip_for_model
+
+MAX_INPUT_TOKENS = 1024  # Encoder context of the BART-family models; Pegasus and T5 use 512
+SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?။])\s+")
+# Once a window is WINDOW_MIN_FILL full, about one sentence in WINDOW_ANCHOR_EVERY
+# (chosen by its hash) starts the next one, so boundaries follow the content
+WINDOW_MIN_FILL = 0.75
+WINDOW_ANCHOR_EVERY = 4
+
 
 def preprocess_text(text: str) -> str:
-    """Clean and normalize input text.
+    """Prepare stored article text for the English models.
+
+    Stored text is already normalized by normalize_text() at scrape time, so
+    only the special characters are removed here, keeping punctuation.
 
     Args:
-        text (str): Raw input text
+        text (str): Article text as stored
 
     Returns:
-        str: Cleaned and normalized text
+        str: Cleaned text
     """
-    # Remove extra whitespace
-    text = re.sub(r"\s+", " ", text.strip())
-    # Remove new line characters
-    text = re.sub(r'\n+', ' ', text)
-    # Remove non-breaking space
-    text = re.sub(r'&nbsp;', '', text)
-    # Remove special characters but keep punctuation
-    text = re.sub(r"[^\w\s.,!?-]", "", text)
+    return strip_for_model(text)
+
+
+def _is_anchor(sentence):
+    """True for about one sentence in WINDOW_ANCHOR_EVERY.
 
-    return text
+    Uses blake2b rather than hash(), which is salted per process, so the
+    same text always gets the same windows and summary cache keys.
+    """
+    digest = hashlib.blake2b(sentence.encode("utf-8"), digest_size=4).digest()
+    return int.from_bytes(digest, "big") % WINDOW_ANCHOR_EVERY == 0
 
 
 class TextSummarizer:
-    def __init__(self, model_name="sshleifer/distilbart-cnn-12-6"):
+    def __init__(self, model_name="sshleifer/distilbart-cnn-12-6", backend=None, cache=None):
         """Initialize the summarizer with a pre-trained model.
 
         Args:
             model_name (str): Name of the pre-trained model to use.
+            backend (str): Inference backend ("torch", "torch-int8" or "onnx"),
+                defaults to SUMMARIZER_CONFIG['backend'].
+            cache (SummaryCache): Persistent summary cache, defaults to the
+                one configured by SUMMARY_CACHE_CONFIG.
         """
-        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        from transformers import AutoTokenizer
+        from news.summarizer_backends import load_backend
+
+        self.model_name = model_name
         self.tokenizer = AutoTokenizer.from_pretrained(model_name)
-        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
-        self.model.to(self.device)
+        self.backend = load_backend(backend or SUMMARIZER_CONFIG['backend'], model_name)
+        self.model = self.backend.model
+        self.device = self.backend.device
+        self.max_input_tokens = min(MAX_INPUT_TOKENS, self.tokenizer.model_max_length)
+        # T5 checkpoints expect a task prefix such as "summarize: "
+        task_params = getattr(self.model.config, "task_specific_params", None) or {}
+        self.prefix = task_params.get("summarization", {}).get("prefix", "")
+        self.cache = cache or get_summary_cache()
+        # Generation defaults of summarize_batch(), so cache keys do not depend on which ones were passed
+        self._generation_defaults = {
+            name: parameter.default for name, parameter in inspect.signature(self.summarize_batch).parameters.items()
+            if parameter.default is not inspect.Parameter.empty and name != "batch_size"
+        }
 
 
     def summarize(self, text, max_length=130, min_length=30, length_penalty=2.0,
@@ -54,87 +98,358 @@ class TextSummarizer:
             early_stopping (bool): Whether to stop when all beams are finished
 
         Returns:
-            str: The generated summary
+            str | None: The generated summary, or None if generation failed
+        """
+        generate_kwargs = dict(max_length=max_length, min_length=min_length, length_penalty=length_penalty,
+                               repetition_penalty=repetition_penalty, num_beams=num_beams,
+                               early_stopping=early_stopping)
+        return self._summarize_cached([text], 1, generate_kwargs)[text]
+
+    def summarize_batch(self, texts, batch_size=8, max_length=130, min_length=30, length_penalty=2.0,
+                        repetition_penalty=2.0, num_beams=4, early_stopping=True):
+        """Generate summaries for many texts, batching inputs of similar length.
+
+        Inputs are sorted by token count and padded only to the longest input
+        of their batch, so short articles do not pay for a 1024-token pass.
+
+        Args:
+            texts (list[str]): The texts to summarize
+            batch_size (int): Number of texts per generate() call
+            Remaining arguments are the same as for summarize().
+
+        Returns:
+            list[str | None]: Summaries in the same order as texts, None
+                where generation failed
+        """
+        import torch
+
+        summaries = [None] * len(texts)  # Failed batches stay None so callers can retry them
+        if not texts:
+            return summaries
+
+        # Tokenize once without padding, then bucket by length
+        input_ids = self.tokenizer([self.prefix + text for text in texts], max_length=self.max_input_tokens,
+                                   truncation=True)["input_ids"]
+        order = sorted(range(len(texts)), key=lambda i: len(input_ids[i]))
+
+        with torch.inference_mode():
+            for start in range(0, len(order), batch_size):
+                bucket = order[start:start + batch_size]
+                try:
+                    inputs = self.tokenizer.pad({"input_ids": [input_ids[i] for i in bucket]},
+                                                padding="longest", return_tensors="pt")
+
+                    # Generate summaries
+                    summary_ids = self.backend.generate(
+                        inputs["input_ids"],
+                        attention_mask=inputs["attention_mask"],
+                        max_length=max_length,
+                        min_length=min_length,
+                        length_penalty=length_penalty,
+                        repetition_penalty=repetition_penalty,
+                        no_repeat_ngram_size=3,
+                        num_beams=num_beams,
+                        early_stopping=early_stopping
+                    )
+                    # Decode the summaries back into input order
+                    decoded = self.tokenizer.batch_decode(summary_ids, skip_special_tokens=True)
+                    for i, summary in zip(bucket, decoded):
+                        summaries[i] = summary
+
+                except Exception as e:
+                    print(f"Error during summarization: {str(e)}")
+
+        return summaries
+
+    def split_windows(self, text, window_tokens=None, overlap_tokens=128):
+        """Split text into overlapping windows that each fit the encoder.
+
+        Windows are packed from whole sentences, and each window repeats the
+        last ~overlap_tokens of the previous one for context. A text that
+        already fits comes back unchanged as a single window.
+
+        Past WINDOW_MIN_FILL of the budget, a window ends before any sentence
+        whose hash marks it as an anchor, rather than only when it is full.
+        Boundaries therefore depend on the nearby sentences and not on
+        everything before them: inserting a sentence changes the windows up
+        to the next anchor, and the later windows, with their cached
+        summaries, stay the same.
+
+        Args:
+            text (str): Cleaned article text
+            window_tokens (int): Token budget per window, special tokens and
+                prefix included; defaults to the model's input limit
+            overlap_tokens (int): Tokens carried over from the previous window
+
+        Returns:
+            list[str]: Window texts in document order
+        """
+        window_tokens = window_tokens or self.max_input_tokens
+        prefix_tokens = len(self.tokenizer(self.prefix, add_special_tokens=False)["input_ids"]) if self.prefix else 0
+        budget = window_tokens - self.tokenizer.num_special_tokens_to_add() - prefix_tokens
+        sentences = [sentence for sentence in SENTENCE_SPLIT_RE.split(text) if sentence.strip()]
+        if not sentences:
+            return [text]
+        # With the leading space each sentence has inside a window, so the counts add up
+        sentence_ids = self.tokenizer([" " + sentence for sentence in sentences], add_special_tokens=False)["input_ids"]
+        if sum(len(ids) for ids in sentence_ids) <= budget:
+            return [text]
+
+        # Sentences longer than a whole window are cut into window-sized pieces
+        pieces = []
+        for sentence, ids in zip(sentences, sentence_ids):
+            if len(ids) <= budget:
+                pieces.append((sentence, len(ids)))
+            else:
+                for i in range(0, len(ids), budget):
+                    chunk = ids[i:i + budget]
+                    pieces.append((self.tokenizer.decode(chunk), len(chunk)))
+
+        min_fill = int(budget * WINDOW_MIN_FILL)
+        windows, current, current_tokens = [], [], 0
+        for piece, n_tokens in pieces:
+            full = current_tokens + n_tokens > budget
+            if current and (full or (current_tokens >= min_fill and _is_anchor(piece))):
+                windows.append(" ".join(p for p, _ in current))
+                # Carry the tail of the finished window over as overlap
+                carried, carried_tokens = [], 0
+                for p, m in reversed(current):
+                    if carried_tokens + m > overlap_tokens:
+                        break
+                    carried.insert(0, (p, m))
+                    carried_tokens += m
+                if carried_tokens + n_tokens > budget:
+                    carried, carried_tokens = [], 0
+                current, current_tokens = carried, carried_tokens
+            current.append((piece, n_tokens))
+            current_tokens += n_tokens
+        windows.append(" ".join(p for p, _ in current))
+        return windows
+
+    def summarize_documents(self, texts, batch_size=8, overlap_tokens=128, **generate_kwargs):
+        """Summarize texts of any length with map-reduce over token windows.
+
+        Texts that fit the encoder are summarized directly. Longer texts are
+        split with split_windows(); the windows of every text are summarized
+        together in batches (map), and each text's chunk summaries are joined
+        and summarized again (reduce). When the joined chunk summaries do not
+        fit one window either, they are windowed and reduced again, level by
+        level, so no part of a long report is cut off by truncation. Every
+        level goes through the persistent summary cache, so re-runs and
+        duplicate wire stories generate nothing new, and an edited article
+        mostly regenerates the windows around the edit.
+
+        Args:
+            texts (list[str]): Cleaned article texts
+            batch_size (int): Windows per generate() call
+            overlap_tokens (int): Overlap between consecutive windows
+            generate_kwargs: Generation arguments accepted by summarize_batch()
+
+        Returns:
+            list[str | None]: One summary per text, in input order, None
+                where generation failed
         """
-        summary = "Summary generation failed."  # Default fallback
-
-        try:
-            # Tokenize the input text
-            inputs = self.tokenizer(text, max_length=1024, truncation=True,
-                                    padding="max_length", return_tensors="pt"
-                                    ).to(self.device)
-
-            # Generate summary
-            summary_ids = self.model.generate(
-                inputs["input_ids"],
-                attention_mask=inputs["attention_mask"],
-                max_length=max_length,
-                min_length=min_length,
-                length_penalty=length_penalty,
-                repetition_penalty=repetition_penalty,
-                no_repeat_ngram_size=3,
-                num_beams=num_beams,
-                early_stopping=early_stopping
-            )
-            # Decode and return the summary
-            summary = self.tokenizer.decode(summary_ids[0], skip_special_tokens=True)
-
-        except Exception as e:(
-            print(f"Error during summarization: {str(e)}"))
-
-        return summary
-
-
-def main():
+        summaries = [None] * len(texts)
+        level = {i: self.split_windows(text, overlap_tokens=overlap_tokens) for i, text in enumerate(texts)}
+        while level:
+            chunk_summaries = self._summarize_cached(
+                [window for text_windows in level.values() for window in text_windows], batch_size, generate_kwargs)
+            next_level = {}
+            for i, text_windows in level.items():
+                if len(text_windows) == 1:
+                    summaries[i] = chunk_summaries[text_windows[0]]
+                    continue
+                # Failed windows are left out; only if all failed does the text fail
+                parts = [chunk_summaries[window] for window in text_windows if chunk_summaries[window] is not None]
+                if not parts:
+                    continue
+                joined = " ".join(parts)
+                # Chunk summaries are independent, so the reduce windows need no overlap
+                reduce_windows = self.split_windows(joined, overlap_tokens=0)
+                if len(reduce_windows) >= len(text_windows):
+                    reduce_windows = [joined]  # Not shrinking (e.g. a huge max_length); truncate instead of looping
+                next_level[i] = reduce_windows
+            level = next_level
+        return summaries
+
+    def _summarize_cached(self, texts, batch_size, generate_kwargs):
+        """Summarize distinct texts through the summary cache, returning {text: summary}."""
+        model = f"{self.model_name}@{self.backend.name}"
+        params = {**self._generation_defaults, **generate_kwargs}
+        keys = {text: cache_key(model, params, text) for text in dict.fromkeys(texts)}
+        cached = self.cache.get_many(keys.values())
+        results = {text: cached[key] for text, key in keys.items() if key in cached}
+
+        missing = [text for text in keys if text not in results]
+        if missing:
+            generated = self.summarize_batch(missing, batch_size=batch_size, **generate_kwargs)
+            results.update(zip(missing, generated))
+            self.cache.put_many(model, {keys[text]: summary for text, summary in zip(missing, generated)
+                                        if summary is not None})
+        return results
+
+
+_burmese_summarizer = None
+
+
+def get_burmese_summarizer():
+    """Load the configured Burmese model once, or return None to use the extractive fallback."""
+    global _burmese_summarizer
+    if _burmese_summarizer is None and SUMMARIZER_CONFIG['burmese_model']:
+        _burmese_summarizer = TextSummarizer(SUMMARIZER_CONFIG['burmese_model'])
+    return _burmese_summarizer
+
+
+def route_article(text, language):
+    """Pick a summarization route for a stored article and clean its text for it.
+
+    Returns:
+        tuple: (route, cleaned text) where route is "en" (English model),
+            "my" (Burmese model) or "extractive" (Zawgyi text that could not
+            be converted, which no model is trained on)
+    """
+    script = detect_script(text)
+    if language != "MM" and script == "latin":
+        return "en", preprocess_text(text)
+    if script == "myanmar-zawgyi":
+        converted = zawgyi_to_unicode(text)
+        if converted is None:
+            return "extractive", text
+        text = normalize_text(converted)
+    return "my", text
+
+
+def summarize_rows(conn, rows, get_summarizer, batch_size=None, extractive=False):
+    """Produce summaries for claimed (id, text, content_hash, language) rows.
+
+    Identical content under another URL (or earlier in rows) reuses its
+    stored summary. Everything else is routed by language and script, and
+    each route is generated in its own batched pass.
+
+    Args:
+        conn: psycopg2 connection used to look up reusable summaries
+        rows (list[tuple]): (id, text, content_hash, language) rows
+        get_summarizer (callable): Returns the English TextSummarizer; only
+            called when an English article actually has to be generated
+        batch_size (int): Windows per generate() call
+        extractive (bool): Surge mode; summarize every route extractively
+            and flag rows that have a model for a later abstractive upgrade
+
+    Returns:
+        tuple: ([(id, summary, summary_kind, upgrade_pending), ...],
+            number of reused summaries); summary is None where generation
+            failed, which save_summaries() leaves in the backlog
+    """
+    from news.extractive import ExtractiveSummarizer
+
+    batch_size = batch_size or SUMMARIZER_CONFIG['batch_size']
+    summaries_by_hash = {key: (summary, kind, False)
+                         for key, (summary, kind) in fetch_summaries_by_hash(conn, [row[2] for row in rows]).items()}
+    pending = {}  # route -> {content key: cleaned text}, one entry per distinct content
+    queued = set()
+    for article_id, raw_text, text_hash, language in rows:
+        key = text_hash or f"id:{article_id}"
+        if key in summaries_by_hash or key in queued:
+            continue
+        queued.add(key)
+        route, cleaned_text = route_article(raw_text, language)
+        pending.setdefault(route, {})[key] = cleaned_text
+
+    for route, texts in pending.items():
+        has_model = route == "en" or (route == "my" and SUMMARIZER_CONFIG['burmese_model'] is not None)
+        if extractive or not has_model:
+            generated = ExtractiveSummarizer().summarize_documents(texts.values())
+            results = [(summary, "extractive", extractive and has_model) for summary in generated]
+        else:
+            summarizer = get_summarizer() if route == "en" else get_burmese_summarizer()
+            generated = summarizer.summarize_documents(list(texts.values()), batch_size=batch_size)
+            results = [(summary, "abstractive", False) for summary in generated]
+        summaries_by_hash.update(zip(texts, results))
+
+    summaries = [(article_id, *summaries_by_hash[text_hash or f"id:{article_id}"])
+                 for article_id, _, text_hash, _ in rows]
+    return summaries, len(rows) - len(queued)
+
+
+def main(extractive=False):
     """
     Fetch raw article text, generate summaries, and update the database
+
+    Args:
+        extractive (bool): Use the fast extractive tier and leave abstractive
+            summaries to a later upgrade pass of the summary worker
     """
     start = time.time()
-    conn = get_db_connection()
 
     try:
-        with conn.cursor() as cur:
-            # Extract article IDs and texts to identify which row to update
-            cur.execute("SELECT id, text FROM news_articles WHERE summary IS NULL;")
-            articles = cur.fetchall()  # List of tuples: [(id1, text1), (id2, text2), ...]
+        with db_connection() as conn:
+            with conn.cursor() as cur:
+                # Extract article IDs, texts, content hashes and languages to identify which row to update
+                cur.execute('SELECT id, text, content_hash, "language" FROM news_articles WHERE summary IS NULL;')
+                articles = cur.fetchall()  # List of tuples: [(id1, text1, hash1, language1), ...]
 
             if not articles:
                 print("✅ No new articles to summarize.")
                 return
 
-            summarizer = TextSummarizer()
-            for article_id, raw_text in articles:
-                cleaned_text = preprocess_text(raw_text)
-                summary = summarizer.summarize(cleaned_text)
+            summaries, reused = summarize_rows(conn, articles, TextSummarizer, extractive=extractive)
+            written = save_summaries(conn, summaries)
 
-                # Update summary in the database
-                cur.execute("""UPDATE news_articles SET summary = %s WHERE id = %s""", (summary, article_id))
-
-        conn.commit()
-        print(f"✅ {len(articles)} summaries saved to the database.")
+        print(f"✅ {written} summaries saved to the database ({reused} reused from identical articles).")
+        if written < len(articles):
+            print(f"⚠️ {len(articles) - written} articles failed and stay in the backlog.")
 
     except Exception as e:
         print(f"❌ Error in main(): {e}")
-        conn.rollback()
-
-    finally:
-        conn.close()
 
     end = time.time()
     print(f"✅ Summarized the articles in {end - start:.2f} seconds.")
 
-if __name__ == "__main__":
-    main()
-
 
-# To preview results in the database:
-conn = get_db_connection()
-with conn.cursor() as cur:
-    cur.execute("""
-            SELECT summary
+def preview(limit=10):
+    """Print the most recently published summaries."""
+    with db_cursor() as cur:
+        cur.execute("""
+            SELECT id, summary_kind, summary
             FROM news_articles
-            """,)
-    result = cur.fetchall()
+            WHERE summary IS NOT NULL
+            ORDER BY published_at DESC, id DESC
+            LIMIT %s
+        """, (limit,))
+        rows = cur.fetchall()
+
+    for article_id, kind, summary in rows:
+        print(f"[{article_id}] ({kind}) {summary}")
+    print(f"✅ {len(rows)} summaries shown.")
+
+
+def warm_up(model_name="sshleifer/distilbart-cnn-12-6", backend=None):
+    """Download (or export) and load the configured models and run one generate().
 
-print(result[-10:])
+    Run once at deploy time so the first real batch does not pay for model
+    downloads, ONNX export or lazy kernel initialisation.
+    """
+    models = [model_name] + [m for m in [SUMMARIZER_CONFIG['burmese_model']] if m]
+    for name in models:
+        start = time.time()
+        summarizer = TextSummarizer(name, backend=backend, cache=SummaryCache.disabled())
+        summarizer.summarize("The earthquake damaged buildings across the region. " * 4,
+                             max_length=20, min_length=5, num_beams=1)
+        print(f"✅ {name} ({summarizer.backend.name}) ready in {time.time() - start:.2f} seconds.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize articles that have no summary yet")
+    parser.add_argument("command", nargs="?", default="summarize", choices=["summarize", "preview", "warmup"])
+    parser.add_argument("--extractive", action="store_true",
+                        help="summarize: fast extractive summaries, upgraded later by the summary worker")
+    parser.add_argument("--limit", type=int, default=10, help="preview: number of summaries to show")
+    parser.add_argument("--backend", help="warmup: backend to prepare (default: SUMMARIZER_BACKEND)")
+    args = parser.parse_args()
 
+    if args.command == "preview":
+        preview(args.limit)
+    elif args.command == "warmup":
+        warm_up(backend=args.backend)
+    else:
+        main(extractive=args.extractive)
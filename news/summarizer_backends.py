@@ -0,0 +1,78 @@
+# Pluggable inference backends for TextSummarizer
+#
+# torch and transformers are imported when a backend is instantiated, so
+# listing BACKENDS (e.g. for argparse choices) stays cheap.
+
+import os
+
+ONNX_EXPORT_DIR = os.getenv('SUMMARIZER_ONNX_DIR', os.path.join('.cache', 'onnx'))
+
+
+class TorchBackend:
+    """Eager fp32 PyTorch, on GPU when one is available."""
+    name = "torch"
+
+    def __init__(self, model_name):
+        import torch
+        from transformers import AutoModelForSeq2SeqLM
+
+        self.device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        self.model.to(self.device)
+        self.model.eval()
+
+    def generate(self, input_ids, attention_mask, **generate_kwargs):
+        return self.model.generate(input_ids.to(self.device), attention_mask=attention_mask.to(self.device),
+                                   **generate_kwargs)
+
+
+class QuantizedTorchBackend(TorchBackend):
+    """PyTorch with nn.Linear weights dynamically quantized to int8 (CPU only)."""
+    name = "torch-int8"
+
+    def __init__(self, model_name):
+        import torch
+        from transformers import AutoModelForSeq2SeqLM
+
+        self.device = "cpu"
+        model = AutoModelForSeq2SeqLM.from_pretrained(model_name)
+        model.eval()
+        self.model = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+
+
+class OnnxBackend:
+    """ONNX Runtime encoder/decoder export that reuses the decoder KV cache.
+
+    Needs the optional `optimum[onnxruntime]` package. The export is written to
+    ONNX_EXPORT_DIR on first use and loaded from there afterwards.
+    """
+    name = "onnx"
+
+    def __init__(self, model_name):
+        try:
+            from optimum.onnxruntime import ORTModelForSeq2SeqLM
+        except ImportError as e:
+            raise ImportError("The onnx backend needs `pip install optimum[onnxruntime]`.") from e
+
+        self.device = "cpu"
+        export_path = os.path.join(ONNX_EXPORT_DIR, model_name.replace("/", "--"))
+        if os.path.isdir(export_path):
+            self.model = ORTModelForSeq2SeqLM.from_pretrained(export_path, use_cache=True)
+        else:
+            self.model = ORTModelForSeq2SeqLM.from_pretrained(model_name, export=True, use_cache=True)
+            self.model.save_pretrained(export_path)
+
+    def generate(self, input_ids, attention_mask, **generate_kwargs):
+        return self.model.generate(input_ids.cpu(), attention_mask=attention_mask.cpu(), **generate_kwargs)
+
+
+BACKENDS = {backend.name: backend for backend in (TorchBackend, QuantizedTorchBackend, OnnxBackend)}
+
+
+def load_backend(name, model_name):
+    """Instantiate the backend registered under name for model_name."""
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown summarizer backend {name!r}; choose one of {', '.join(BACKENDS)}") from None
+    return backend(model_name)
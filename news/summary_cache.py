@@ -0,0 +1,127 @@
+# Persistent summary cache keyed by model, generation parameters and text hash
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+
+from news.config import SUMMARY_CACHE_CONFIG
+
+
+def cache_key(model, params, text):
+    """SHA-256 identifying one summary: model (with backend), generation params and input text.
+
+    Args:
+        model (str): Model name, e.g. "sshleifer/distilbart-cnn-12-6@torch"
+        params (dict): Generation parameters that influence the output
+        text (str): Normalized input text
+    """
+    text_hash = hashlib.sha256(text.encode("utf-8")).hexdigest()
+    encoded_params = json.dumps(params, sort_keys=True, default=str)
+    return hashlib.sha256(f"{model}\x1f{encoded_params}\x1f{text_hash}".encode("utf-8")).hexdigest()
+
+
+class SummaryCache:
+    """SQLite store of generated summaries, evicted least-recently-used first past max_bytes.
+
+    The file may be shared by several processes (the summary pool, the
+    worker and benchmarks), so it runs in WAL mode with a busy timeout.
+    """
+
+    def __init__(self, path, max_bytes, bypass=False):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS summaries (
+                key TEXT PRIMARY KEY,
+                model TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                size INTEGER NOT NULL,
+                last_used REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS summaries_last_used ON summaries (last_used)")
+        self._conn.commit()
+
+    @classmethod
+    def disabled(cls):
+        """An in-memory cache that never hits, for benchmarks and warm-up runs."""
+        return cls(":memory:", 0, bypass=True)
+
+    def get_many(self, keys):
+        """Return {key: summary} for the cached keys, marking them recently used."""
+        keys = list(dict.fromkeys(keys))
+        if self.bypass or not keys:
+            self.misses += len(keys)
+            return {}
+        found = {}
+        with self._lock:
+            for start in range(0, len(keys), 500):  # Stay under SQLite's bound-parameter limit
+                page = keys[start:start + 500]
+                placeholders = ", ".join("?" * len(page))
+                found.update(self._conn.execute(
+                    f"SELECT key, summary FROM summaries WHERE key IN ({placeholders})", page).fetchall())
+            if found:
+                self._conn.executemany("UPDATE summaries SET last_used = ? WHERE key = ?",
+                                       [(time.time(), key) for key in found])
+                self._conn.commit()
+        self.hits += len(found)
+        self.misses += len(keys) - len(found)
+        return found
+
+    def put_many(self, model, summaries):
+        """Store {key: summary} generated by model, then evict down to max_bytes."""
+        if self.bypass or not summaries:
+            return
+        now = time.time()
+        rows = [(key, model, summary, len(summary.encode("utf-8")), now) for key, summary in summaries.items()]
+        with self._lock:
+            self._conn.executemany("""
+                INSERT OR REPLACE INTO summaries (key, model, summary, size, last_used)
+                VALUES (?, ?, ?, ?, ?)
+            """, rows)
+            self._evict()
+            self._conn.commit()
+
+    def stats(self):
+        with self._lock:
+            total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+        return {'hits': self.hits, 'misses': self.misses, 'bytes': total_bytes}
+
+    def _evict(self):
+        # Other processes write to the same file, so recount instead of tracking a total
+        total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM summaries").fetchone()[0]
+        if total_bytes <= self.max_bytes:
+            return
+        excess = total_bytes - self.max_bytes
+        victims, freed = [], 0
+        for key, size in self._conn.execute("SELECT key, size FROM summaries ORDER BY last_used"):
+            victims.append((key,))
+            freed += size
+            if freed >= excess:
+                break
+        self._conn.executemany("DELETE FROM summaries WHERE key = ?", victims)
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_summary_cache():
+    """Return the process-wide cache configured from SUMMARY_CACHE_CONFIG."""
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SummaryCache(**SUMMARY_CACHE_CONFIG)
+    return _cache
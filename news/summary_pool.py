@@ -0,0 +1,135 @@
+# Multi-process summarization of the backlog across CPU cores
+#
+# Each process holds its own model with torch intra-op threads capped, which
+# scales better on many-core hosts than one process with many threads. Rows
+# are claimed through the summary worker's SKIP LOCKED queue, so pools and
+# workers can run side by side.
+#
+#   python -m news.summary_pool --processes 4 --threads 2
+
+import argparse
+import math
+import multiprocessing
+import os
+import time
+
+from news.article_store import save_summaries
+from news.config import SUMMARIZER_CONFIG
+from news.db_connection import db_connection
+from news.summarizer import summarize_rows
+from news.summary_worker import CLAIM_BATCH_QUERY
+
+_worker_summarizer = None  # One per pool process, created by _init_worker
+
+
+def _init_worker(model_name, backend, threads):
+    import torch
+    from news.summarizer import TextSummarizer
+
+    global _worker_summarizer
+    torch.set_num_threads(threads)
+    _worker_summarizer = TextSummarizer(model_name, backend=backend)
+
+
+def _summarize_shard(task):
+    start, texts, batch_size = task
+    return start, _worker_summarizer.summarize_documents(texts, batch_size=batch_size)
+
+
+class ProcessPoolSummarizer:
+    """Drop-in for TextSummarizer.summarize_documents() that shards work over processes."""
+
+    def __init__(self, processes, threads_per_process=None, model_name="sshleifer/distilbart-cnn-12-6",
+                 backend=None):
+        self.processes = processes
+        self.threads_per_process = threads_per_process or max(1, (os.cpu_count() or 1) // processes)
+        # torch is not fork-safe once initialised, so always start fresh interpreters
+        context = multiprocessing.get_context("spawn")
+        self._pool = context.Pool(processes, initializer=_init_worker,
+                                  initargs=(model_name, backend, self.threads_per_process))
+
+    def summarize_documents(self, texts, batch_size=8, shard_size=None):
+        """Summarize texts on the pool, returning summaries in input order.
+
+        Texts are sorted by length before sharding so each shard pads little,
+        and shards are small enough (about four per process) to balance load.
+        """
+        if not texts:
+            return []
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        shard_size = shard_size or max(batch_size, math.ceil(len(texts) / (self.processes * 4)))
+        tasks = [(start, [texts[i] for i in order[start:start + shard_size]], batch_size)
+                 for start in range(0, len(order), shard_size)]
+
+        summaries = [None] * len(texts)
+        for start, shard_summaries in self._pool.imap_unordered(_summarize_shard, tasks):
+            for offset, summary in enumerate(shard_summaries):
+                summaries[order[start + offset]] = summary
+        return summaries
+
+    def close(self):
+        self._pool.close()
+        self._pool.join()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def run_pool(processes, threads_per_process=None, batch_size=None, claim_size=None):
+    """Summarize the summary IS NULL backlog on a pool of processes.
+
+    Rows are claimed claim_size at a time with the summary worker's
+    FOR UPDATE SKIP LOCKED query and committed claim by claim. The pool can
+    therefore run next to news.summary_worker or another pool without
+    summarizing the same rows twice, and a scraper update to a claimed row
+    waits for the commit and then clears the stale summary.
+    """
+    batch_size = batch_size or SUMMARIZER_CONFIG['batch_size']
+    claim_size = claim_size or processes * batch_size * 8  # Enough shards to keep every process busy
+    start = time.time()
+    claimed = written = reused = 0
+    pool = None
+
+    def get_summarizer():
+        nonlocal pool
+        if pool is None:
+            pool = ProcessPoolSummarizer(processes, threads_per_process)
+        return pool
+
+    try:
+        with db_connection() as conn:
+            while True:
+                with conn.cursor() as cur:
+                    cur.execute(CLAIM_BATCH_QUERY, (SUMMARIZER_CONFIG['retry_delay'], claim_size))
+                    rows = cur.fetchall()
+                if not rows:
+                    break
+                summaries, batch_reused = summarize_rows(conn, rows, get_summarizer, batch_size)
+                written += save_summaries(conn, summaries)
+                conn.commit()  # Releases the row locks
+                claimed += len(rows)
+                reused += batch_reused
+    finally:
+        if pool is not None:
+            pool.close()
+
+    if not claimed:
+        print("✅ No new articles to summarize.")
+        return
+    print(f"✅ {written} summaries saved ({reused} reused) by {processes} processes "
+          f"in {time.time() - start:.2f} seconds.")
+    if written < claimed:
+        print(f"⚠️ {claimed - written} articles failed and will be retried later.")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize the backlog with a pool of processes")
+    parser.add_argument("--processes", type=int, default=max(1, (os.cpu_count() or 1) // 2))
+    parser.add_argument("--threads", type=int, help="torch threads per process (default: cores / processes)")
+    parser.add_argument("--batch-size", type=int, default=SUMMARIZER_CONFIG['batch_size'])
+    parser.add_argument("--claim-size", type=int, help="rows claimed and committed at a time")
+    args = parser.parse_args()
+    run_pool(args.processes, args.threads, args.batch_size, args.claim_size)
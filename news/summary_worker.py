@@ -0,0 +1,193 @@
+# Long-running summarization worker fed by a Postgres job queue
+#
+# The model is loaded once. Backlog rows (summary IS NULL) are claimed in
+# batches with FOR UPDATE SKIP LOCKED and committed batch by batch, so several
+# worker processes can share the backlog and a crash only loses the batch in
+# flight. Between batches the worker sleeps on LISTEN until a scraper NOTIFYs.
+# Rows whose generation fails keep summary NULL and are claimed again after
+# SUMMARIZER_CONFIG['retry_delay'] seconds.
+#
+# When the backlog is larger than SUMMARIZER_CONFIG['surge_threshold'] it is
+# first filled with fast extractive summaries so every article has one within
+# seconds; those rows are marked upgrade_pending and re-summarized with the
+# model once the backlog is empty.
+#
+#   python -m news.summary_worker            # run forever
+#   python -m news.summary_worker --drain    # empty the backlog, then exit
+
+import argparse
+import select
+import signal
+import time
+
+import psycopg2
+from news.article_store import SUMMARY_QUEUE_CHANNEL, save_summaries
+from news.config import SUMMARIZER_CONFIG
+from news.db_connection import db_connection, get_db_connection
+from news.summarizer import TextSummarizer, summarize_rows
+
+# Rows whose generation failed wait retry_delay seconds, so they cannot stall the queue head
+CLAIM_BATCH_QUERY = """
+    SELECT id, text, content_hash, "language"
+    FROM news_articles
+    WHERE summary IS NULL
+      AND (summary_failed_at IS NULL OR summary_failed_at < now() - make_interval(secs => %s))
+    ORDER BY id
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+"""
+
+CLAIM_UPGRADE_BATCH_QUERY = """
+    SELECT id, text, content_hash, "language"
+    FROM news_articles
+    WHERE upgrade_pending
+      AND (summary_failed_at IS NULL OR summary_failed_at < now() - make_interval(secs => %s))
+    ORDER BY id
+    LIMIT %s
+    FOR UPDATE SKIP LOCKED
+"""
+
+STOP_POLL_INTERVAL = 1.0  # Seconds between _stopping checks while idle; PEP 475 restarts select on a signal
+
+_stopping = False
+
+
+def _request_stop(signum, frame):
+    global _stopping
+    _stopping = True
+
+
+def process_batch(conn, summarizer, batch_size, extractive=False, upgrade=False):
+    """Claim up to batch_size rows, summarize them and commit.
+
+    Args:
+        extractive (bool): Write fast extractive summaries (backlog surge)
+        upgrade (bool): Claim upgrade_pending rows instead of the backlog
+
+    Returns:
+        int: Number of rows claimed, failed ones included (0 when there is nothing to claim)
+    """
+    with conn.cursor() as cur:
+        cur.execute(CLAIM_UPGRADE_BATCH_QUERY if upgrade else CLAIM_BATCH_QUERY,
+                    (SUMMARIZER_CONFIG['retry_delay'], batch_size))
+        rows = cur.fetchall()
+    if not rows:
+        conn.commit()
+        return 0
+
+    summaries, reused = summarize_rows(conn, rows, lambda: summarizer, batch_size, extractive=extractive)
+    written = save_summaries(conn, summaries)
+    conn.commit()  # Releases the row locks
+    kind = "Upgraded" if upgrade else "Extractively summarized" if extractive else "Summarized"
+    print(f"✅ {kind} {written} articles ({reused} reused from identical articles).")
+    if written < len(rows):
+        print(f"⚠️ {len(rows) - written} articles failed and will be retried later.")
+    return len(rows)
+
+
+def backlog_size(conn):
+    with conn.cursor() as cur:
+        cur.execute("SELECT count(*) FROM news_articles WHERE summary IS NULL")
+        return cur.fetchone()[0]
+
+
+def drain_backlog(summarizer, batch_size, surge_threshold=None):
+    """Summarize the backlog, then upgrade provisional extractive summaries.
+
+    Returns:
+        int: Number of rows written
+    """
+    surge_threshold = SUMMARIZER_CONFIG['surge_threshold'] if surge_threshold is None else surge_threshold
+    total = 0
+    with db_connection() as conn:
+        if backlog_size(conn) > surge_threshold:
+            # Extractive batches are cheap, so claim more rows per transaction
+            while not _stopping:
+                done = process_batch(conn, summarizer, batch_size * 16, extractive=True)
+                if not done:
+                    break
+                total += done
+        while not _stopping:
+            # New articles go first; upgrades only use otherwise idle capacity
+            done = (process_batch(conn, summarizer, batch_size)
+                    or process_batch(conn, summarizer, batch_size, upgrade=True))
+            if not done:
+                break
+            total += done
+    return total
+
+
+def _listen():
+    conn = get_db_connection()  # Dedicated connection; LISTEN does not belong in the pool
+    conn.autocommit = True
+    with conn.cursor() as cur:
+        cur.execute(f"LISTEN {SUMMARY_QUEUE_CHANNEL}")
+    return conn
+
+
+def wait_for_articles(listen_conn, timeout):
+    """Block until a scraper NOTIFYs, timeout seconds pass or a stop is requested."""
+    deadline = time.monotonic() + timeout
+    while not _stopping:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return
+        if select.select([listen_conn], [], [], min(STOP_POLL_INTERVAL, remaining)) != ([], [], []):
+            listen_conn.poll()
+            listen_conn.notifies.clear()
+            return
+
+
+def _sleep(seconds):
+    """time.sleep() that returns early once a stop is requested."""
+    deadline = time.monotonic() + seconds
+    while not _stopping and time.monotonic() < deadline:
+        time.sleep(min(STOP_POLL_INTERVAL, deadline - time.monotonic()))
+
+
+def run_worker(batch_size=None, idle_timeout=None, drain=False, model_name="sshleifer/distilbart-cnn-12-6"):
+    """Summarize the backlog, then keep waiting for new articles.
+
+    Args:
+        batch_size (int): Rows claimed (and committed) per batch
+        idle_timeout (float): Seconds to sleep without a NOTIFY before checking
+            the backlog anyway
+        drain (bool): Exit once the backlog is empty instead of listening
+        model_name (str): Summarization model to load
+    """
+    batch_size = batch_size or SUMMARIZER_CONFIG['batch_size']
+    idle_timeout = idle_timeout or SUMMARIZER_CONFIG['worker_idle_timeout']
+    signal.signal(signal.SIGTERM, _request_stop)
+    signal.signal(signal.SIGINT, _request_stop)
+
+    summarizer = TextSummarizer(model_name)
+    listen_conn = None if drain else _listen()
+    try:
+        while not _stopping:
+            try:
+                total = drain_backlog(summarizer, batch_size)
+                if total:
+                    print(f"✅ Backlog cleared ({total} articles).")
+                if drain:
+                    break
+                if listen_conn is None or listen_conn.closed:
+                    listen_conn = _listen()
+                wait_for_articles(listen_conn, idle_timeout)
+            except psycopg2.OperationalError as e:
+                print(f"❌ Database unavailable, retrying: {e}")
+                if listen_conn is not None and not listen_conn.closed:
+                    listen_conn.close()
+                listen_conn = None
+                _sleep(5)
+    finally:
+        if listen_conn is not None and not listen_conn.closed:
+            listen_conn.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Summarize new articles as they arrive")
+    parser.add_argument("--batch-size", type=int, help="rows claimed and committed per batch")
+    parser.add_argument("--idle-timeout", type=float, help="seconds between backlog checks without a NOTIFY")
+    parser.add_argument("--drain", action="store_true", help="exit once the backlog is empty")
+    args = parser.parse_args()
+    run_worker(batch_size=args.batch_size, idle_timeout=args.idle_timeout, drain=args.drain)
@@ -0,0 +1,43 @@
+# Shared text normalization, applied once when articles are stored
+#
+# normalize_text() is safe for every script: it decodes HTML entities, drops
+# invisible format characters and collapses all whitespace (non-breaking
+# spaces included), but never removes letters, so Myanmar text survives intact.
+# strip_for_model() additionally drops symbols the English models were not
+# trained on and expects already-normalized input.
+
+import html
+import re
+
+# Zero-width spaces/joiners, word joiner, BOM and soft hyphen carry no text.
+# Non-breaking and other Unicode spaces need no table: str.split() handles them.
+INVISIBLE_CHARS_RE = re.compile("[\u200b-\u200d\u2060\ufeff\u00ad]+")
+MODEL_UNSAFE_CHARS_RE = re.compile(r"[^\w\s.,!?-]+")
+
+
+def normalize_text(text):
+    """Decode entities, drop invisible characters and collapse all whitespace.
+
+    Args:
+        text (str): Scraped title, excerpt or article body
+
+    Returns:
+        str: Normalized text ("" for None)
+    """
+    if not text:
+        return ""
+    if "&" in text:
+        text = html.unescape(text)
+    return " ".join(INVISIBLE_CHARS_RE.sub("", text).split())
+
+
+def strip_for_model(text):
+    """Drop characters other than word characters and basic punctuation.
+
+    Args:
+        text (str): Text already passed through normalize_text()
+
+    Returns:
+        str: Text for the English summarization models
+    """
+    return " ".join(MODEL_UNSAFE_CHARS_RE.sub("", text).split())
@@ -0,0 +1,175 @@
+# Tests for news/fetcher.py against a local HTTP stand-in serving fixture pages
+#
+#   python -m pytest tests
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+import requests
+
+import news.fetcher as fetcher
+from news.http_cache import HttpCache
+from news.listing import scrape_listing
+from news.MMNow_scraper import parse_listing, scrape_article_text
+
+FIXTURES = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def _fixture(name):
+    with open(os.path.join(FIXTURES, name), encoding="utf-8") as f:
+        return f.read()
+
+
+class StandIn(ThreadingHTTPServer):
+    """Records every request and how many were in flight at once."""
+
+    daemon_threads = True
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.base = f"http://127.0.0.1:{self.server_address[1]}"
+        self.lock = threading.Lock()
+        self.requests = []  # (path, monotonic start time, If-None-Match)
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.failures = {}  # path -> status codes still to send before succeeding
+
+
+class Handler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.requests.append((self.path, time.monotonic(), self.headers.get("If-None-Match")))
+            server.in_flight += 1
+            server.max_in_flight = max(server.max_in_flight, server.in_flight)
+            pending = server.failures.get(self.path)
+            status = pending.pop(0) if pending else None
+        try:
+            if status:
+                self._send(status, b"")
+            elif self.path == "/listing":
+                self._send(200, _fixture("listing.html").replace("{base}", server.base).encode())
+            elif self.path.startswith("/article/"):
+                article_id = self.path.rsplit("/", 1)[1]
+                time.sleep(float(article_id) * 0.05 if article_id.isdigit() else 0.1)
+                self._send(200, _fixture("article.html").replace("{id}", article_id).encode())
+            elif self.path == "/cached":
+                if self.headers.get("If-None-Match") == '"v1"':
+                    self._send(304, b"", {"ETag": '"v1"'})
+                else:
+                    self._send(200, b"cached page", {"ETag": '"v1"'})
+            else:
+                self._send(404, b"not found")
+        finally:
+            with server.lock:
+                server.in_flight -= 1
+
+    def _send(self, status, body, headers=None):
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        if status != 304:
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if status != 304:
+            self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    stand_in = StandIn()
+    thread = threading.Thread(target=stand_in.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield stand_in
+    stand_in.shutdown()
+    stand_in.server_close()
+
+
+@pytest.fixture(autouse=True)
+def isolated(monkeypatch, tmp_path):
+    """No politeness delay and a throwaway HTTP cache for every test."""
+    cache = HttpCache(str(tmp_path / "http_cache.sqlite3"), max_bytes=1024 * 1024)
+    monkeypatch.setattr(fetcher, "_throttle", fetcher.HostThrottle(0))
+    monkeypatch.setattr(fetcher, "get_http_cache", lambda: cache)
+    return cache
+
+
+def test_fetch_concurrently_bounds_concurrency(server):
+    urls = [f"{server.base}/article/slow-{i}" for i in range(8)]
+    results = list(fetcher.fetch_concurrently(urls, fetcher.fetch, max_workers=3))
+
+    assert sorted(url for url, _, _ in results) == sorted(urls)
+    assert all(error is None for _, _, error in results)
+    assert server.max_in_flight == 3
+
+
+def test_fetch_concurrently_streams_results_as_they_finish(server):
+    # Article n takes n * 50 ms, so the slowest is submitted first and should arrive last
+    urls = [f"{server.base}/article/{n}" for n in (6, 1, 3)]
+    results = fetcher.fetch_concurrently(urls, fetcher.fetch, max_workers=3)
+
+    first_url, first_response, _ = next(results)
+    assert first_url.endswith("/article/1")
+    assert b"Body of article 1" in first_response.content
+    assert [url.rsplit("/", 1)[1] for url, _, _ in results] == ["3", "6"]
+
+
+def test_fetch_concurrently_reports_errors_per_url(server):
+    urls = [f"{server.base}/article/1", f"{server.base}/missing"]
+    results = {url: (result, error) for url, result, error in
+               fetcher.fetch_concurrently(urls, lambda url: fetcher.fetch(url, retries=0), max_workers=2)}
+
+    assert results[urls[0]][1] is None
+    assert results[urls[1]][0] is None
+    assert isinstance(results[urls[1]][1], requests.HTTPError)
+
+
+def test_host_throttle_spaces_requests_per_host(server, monkeypatch):
+    monkeypatch.setattr(fetcher, "_throttle", fetcher.HostThrottle(0.1))
+    urls = [f"{server.base}/article/0" for _ in range(4)]
+    list(fetcher.fetch_concurrently(urls, fetcher.fetch, max_workers=4))
+
+    starts = sorted(start for _, start, _ in server.requests)
+    gaps = [b - a for a, b in zip(starts, starts[1:])]
+    assert len(starts) == 4
+    assert min(gaps) >= 0.09
+
+
+def test_fetch_retries_503_and_429_then_succeeds(server):
+    server.failures["/listing"] = [503, 429]
+    response = fetcher.fetch(f"{server.base}/listing", retries=3, backoff=0.01)
+
+    assert response.status_code == 200
+    assert [path for path, _, _ in server.requests] == ["/listing"] * 3
+
+
+def test_fetch_raises_when_retries_are_exhausted(server):
+    server.failures["/listing"] = [503, 503, 503]
+    with pytest.raises(requests.HTTPError):
+        fetcher.fetch(f"{server.base}/listing", retries=2, backoff=0.01)
+    assert len(server.requests) == 3
+
+
+def test_unchanged_page_is_served_from_disk_cache(server, isolated):
+    first = fetcher.fetch(f"{server.base}/cached")
+    second = fetcher.fetch(f"{server.base}/cached")
+
+    assert first.content == second.content == b"cached page"
+    assert [etag for _, _, etag in server.requests] == [None, '"v1"']
+    assert isolated.stats()["hits"] == 1
+
+
+def test_listing_and_article_pages_parse(server):
+    articles = scrape_listing(f"{server.base}/listing", parse_listing)
+
+    assert [article.title for article in articles] == ["Rescue teams reach Sagaing", "Mandalay hospitals overwhelmed"]
+    assert articles[0].timestamp == "2 hours ago"
+    text = scrape_article_text(articles[1].url)
+    assert text == "Body of article 2. Rescue work continued through the night."
@@ -0,0 +1,146 @@
+# In-memory index of the /donations list by category and location
+#
+# The list is fetched through the shared fetch cache, so it is downloaded at
+# most once per TTL. get_json() hands back the same object until the backend
+# reports a new version (new ETag / body), which makes "has it changed?" an
+# identity check; only then are the changed items re-indexed.
+
+import hashlib
+import json
+import threading
+
+from utils.fetch_cache import get_json
+
+
+def _item_keys(items):
+    """Stable keys for items: the backend id, else a hash of the whole entry.
+
+    Entries without an id that are identical in every field are told apart
+    by their occurrence number, so none of them is merged into another.
+    """
+    keys, seen = [], {}
+    for item in items:
+        if item.get('id') is not None:
+            keys.append(item['id'])
+            continue
+        digest = hashlib.sha1(json.dumps(item, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        seen[digest] = seen.get(digest, -1) + 1
+        keys.append((digest, seen[digest]))
+    return keys
+
+
+def _normalize(item):
+    locations = item.get('locations') or []
+    if isinstance(locations, str):
+        locations = [loc.strip() for loc in locations.split(",") if loc.strip()]
+    return {**item, 'category': (item.get('category') or "").lower(), 'locations': locations}
+
+
+class DonationsIndex:
+    """Donation entries grouped by category and by (category, location).
+
+    Lookups return prebuilt lists in backend order. update() only relinks
+    items that were added, removed or changed, and only re-sorts the
+    buckets they belong to; entries that merely shifted position (e.g.
+    after an insertion at the top) just get their position refreshed.
+    """
+
+    def __init__(self, items=()):
+        self.source = None  # The list object the index was last built from
+        self.version = 0
+        self._items = {}  # item key -> (position, normalized item)
+        self._buckets = {}  # category or (category, location) -> {item key: position}
+        self._views = {}  # bucket -> list of items, in backend order
+        self._location_sets = {}  # category -> location names with at least one entry
+        self._locations = {}  # category -> sorted location names
+        self.update(items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def update(self, items):
+        """Re-index the entries of items that differ from the current ones."""
+        if items is self.source:
+            return
+        new = {}
+        for position, (key, item) in enumerate(zip(_item_keys(items), items)):
+            new[key] = (position, _normalize(item))
+
+        touched = set()
+        for key, (_, item) in self._items.items():
+            if key not in new or new[key][1] != item:
+                touched |= self._unlink(key, item)
+        kept = []  # Keys of unchanged items, in their old order
+        for key, (position, item) in new.items():
+            old = self._items.get(key)
+            if old is None or old[1] != item:
+                touched |= self._link(key, position, item)
+                continue
+            new[key] = (position, old[1])  # Keep the object the views already hold
+            kept.append(key)
+            for bucket in self._buckets_of(item):
+                self._buckets[bucket][key] = position
+
+        # Shifted positions only matter where unchanged items swapped order
+        kept.sort(key=lambda key: self._items[key][0])
+        if any(new[a][0] > new[b][0] for a, b in zip(kept, kept[1:])):
+            touched |= {bucket for key in kept for bucket in self._buckets_of(new[key][1])}
+
+        self._items = new
+        for bucket in touched:
+            members = self._buckets.get(bucket)
+            if members:
+                self._views[bucket] = [self._items[key][1] for key in sorted(members, key=members.get)]
+            else:
+                self._buckets.pop(bucket, None)
+                self._views.pop(bucket, None)
+            if isinstance(bucket, tuple):
+                category, location = bucket
+                if members:
+                    self._location_sets.setdefault(category, set()).add(location)
+                else:
+                    self._location_sets.get(category, set()).discard(location)
+        for category in {bucket[0] for bucket in touched if isinstance(bucket, tuple)}:
+            self._locations[category] = sorted(self._location_sets[category])
+        self.source = items
+        self.version += 1
+
+    def _buckets_of(self, item):
+        return [item['category']] + [(item['category'], loc) for loc in item['locations']]
+
+    def _link(self, key, position, item):
+        buckets = self._buckets_of(item)
+        for bucket in buckets:
+            self._buckets.setdefault(bucket, {})[key] = position
+        return set(buckets)
+
+    def _unlink(self, key, item):
+        buckets = self._buckets_of(item)
+        for bucket in buckets:
+            self._buckets.get(bucket, {}).pop(key, None)
+        return set(buckets)
+
+    def category(self, category):
+        return self._views.get(category.lower(), [])
+
+    def filter(self, category, location=None):
+        """Entries of category, optionally only those serving location."""
+        if location is None:
+            return self.category(category)
+        return self._views.get((category.lower(), location), [])
+
+    def locations(self, category):
+        return self._locations.get(category.lower(), [])
+
+
+_index = DonationsIndex()
+_index_lock = threading.Lock()
+
+
+def get_donations_index(url):
+    """Return the shared index, re-indexed if the backend has a new version of url."""
+    items = get_json("donations", url)
+    if items is not _index.source:
+        with _index_lock:
+            _index.update(items)
+    return _index
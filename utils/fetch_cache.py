@@ -0,0 +1,170 @@
+# Cross-session TTL cache for the frontend's JSON fetches
+#
+# Streamlit reruns the whole script on every interaction and runs every
+# session in the same process, so one module-level cache serves all users:
+#   - entries younger than their endpoint's TTL are returned directly;
+#   - entries within the stale-while-revalidate window are returned at once
+#     while a single background request refreshes them;
+#   - refreshes send If-None-Match / If-Modified-Since, so an unchanged
+#     payload costs the backend a 304 without a body;
+#   - when a refresh fails, the last good value keeps being served.
+
+import os
+import statistics
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from utils.http_session import get_session
+
+# endpoint name -> (TTL, stale-while-revalidate window) in seconds
+ENDPOINT_TTLS = {
+    "crisis-data": (60, 600),
+    "donations": (300, 3600),
+    "news": (120, 600),
+    "earthquakes": (60, 300),
+}
+DEFAULT_TTL = (60, 300)
+REFRESH_WORKERS = int(os.getenv('FETCH_CACHE_WORKERS', 4))
+
+
+@dataclass
+class CacheEntry:
+    value: object
+    etag: str = None
+    last_modified: str = None
+    fetched_at: float = 0.0
+
+
+@dataclass
+class EndpointStats:
+    hits: int = 0
+    stale_hits: int = 0
+    misses: int = 0
+    not_modified: int = 0
+    errors: int = 0
+    latencies_ms: deque = field(default_factory=lambda: deque(maxlen=100))
+
+
+_entries = {}  # (url, params) -> CacheEntry
+_stats = {}  # endpoint name -> EndpointStats
+_in_flight = {}  # (url, params) -> Future of the running request
+_lock = threading.RLock()  # Re-entered when a done callback runs on an already finished future
+_executor = ThreadPoolExecutor(max_workers=REFRESH_WORKERS, thread_name_prefix="fetch-cache")
+
+
+def _fetch(name, key, url, params):
+    with _lock:
+        entry = _entries.get(key)
+        stats = _stats.setdefault(name, EndpointStats())
+    headers = {}
+    if entry is not None and entry.etag:
+        headers['If-None-Match'] = entry.etag
+    if entry is not None and entry.last_modified:
+        headers['If-Modified-Since'] = entry.last_modified
+
+    start = time.perf_counter()
+    try:
+        response = get_session().get(url, params=params, headers=headers)
+        if response.status_code == 304 and entry is not None:
+            fresh = CacheEntry(entry.value, entry.etag, entry.last_modified, time.time())
+            stats.not_modified += 1
+        else:
+            response.raise_for_status()
+            fresh = CacheEntry(response.json(), response.headers.get('ETag'),
+                               response.headers.get('Last-Modified'), time.time())
+    except Exception:
+        stats.errors += 1
+        raise
+    finally:
+        stats.latencies_ms.append((time.perf_counter() - start) * 1000)
+
+    with _lock:
+        _entries[key] = fresh
+    return fresh
+
+
+def _refresh(name, key, url, params):
+    """Start (or join) the single request refreshing key."""
+    with _lock:
+        future = _in_flight.get(key)
+        if future is None:
+            future = _executor.submit(_fetch, name, key, url, params)
+            _in_flight[key] = future
+            future.add_done_callback(lambda _: _forget(key))
+    return future
+
+
+def _forget(key):
+    with _lock:
+        _in_flight.pop(key, None)
+
+
+def get_json(name, url, params=None):
+    """Return the JSON body of GET url through the shared cache.
+
+    Args:
+        name (str): Endpoint name, selects the TTLs in ENDPOINT_TTLS and the
+            stats bucket
+        url (str): URL to fetch
+        params (dict): Query parameters
+
+    Returns:
+        The decoded JSON, shared between sessions, so do not mutate it
+
+    Raises:
+        requests.exceptions.RequestException: The fetch failed and there is
+            no earlier value to fall back to
+    """
+    key = (url, tuple(sorted((params or {}).items())))
+    ttl, stale_ttl = ENDPOINT_TTLS.get(name, DEFAULT_TTL)
+    with _lock:
+        entry = _entries.get(key)
+        stats = _stats.setdefault(name, EndpointStats())
+
+    if entry is not None:
+        age = time.time() - entry.fetched_at
+        if age < ttl:
+            stats.hits += 1
+            return entry.value
+        if age < ttl + stale_ttl:
+            stats.stale_hits += 1
+            _refresh(name, key, url, params)
+            return entry.value
+
+    stats.misses += 1
+    try:
+        return _refresh(name, key, url, params).result().value
+    except Exception:
+        if entry is not None:
+            return entry.value  # Too stale, but better than an error page
+        raise
+
+
+def cache_stats():
+    """Per-endpoint counters and latency for the debug panel."""
+    with _lock:
+        snapshot = dict(_stats)
+    rows = []
+    for name, stats in sorted(snapshot.items()):
+        latencies = list(stats.latencies_ms)
+        requests_made = stats.hits + stats.stale_hits + stats.misses
+        rows.append({
+            "endpoint": name,
+            "hits": stats.hits,
+            "stale": stats.stale_hits,
+            "misses": stats.misses,
+            "304s": stats.not_modified,
+            "errors": stats.errors,
+            "hit_rate": round((stats.hits + stats.stale_hits) / requests_made, 2) if requests_made else 0.0,
+            "p50_ms": round(statistics.median(latencies), 1) if latencies else None,
+            "max_ms": round(max(latencies), 1) if latencies else None,
+        })
+    return rows
+
+
+def clear_cache():
+    with _lock:
+        _entries.clear()
@@ -0,0 +1,214 @@
+# Reverse geocoding for earthquake events: disk cache, offline gazetteer, concurrent lookups
+#
+# reverse_geocode_many() answers from a SQLite cache keyed by rounded lat/lon.
+# Cache misses are looked up on Nominatim concurrently and in the background;
+# whatever has not arrived within `wait` seconds is labelled from the bundled
+# Myanmar gazetteer instead, and the Nominatim answer is cached for the next
+# render. The public Nominatim instance allows one request per second, so
+# point NOMINATIM_URL at a self-hosted instance and set
+# NOMINATIM_MIN_INTERVAL=0 to use the full concurrency.
+
+import csv
+import math
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait as wait_for
+from dataclasses import dataclass
+
+from utils.http_session import get_session
+
+NOMINATIM_URL = os.getenv('NOMINATIM_URL', "https://nominatim.openstreetmap.org/reverse")
+NOMINATIM_MIN_INTERVAL = float(os.getenv('NOMINATIM_MIN_INTERVAL', 1.0))  # Seconds between requests
+GEOCODE_WORKERS = int(os.getenv('GEOCODE_WORKERS', 4))
+GEOCODE_CACHE_PATH = os.getenv('GEOCODE_CACHE_PATH', os.path.join('.cache', 'geocode.sqlite3'))
+GEOCODE_CACHE_TTL = float(os.getenv('GEOCODE_CACHE_TTL', 30 * 24 * 3600))  # Place names rarely change
+GEOCODE_PRECISION = 2  # Decimal places of the cache key, about 1 km
+GAZETTEER_PATH = os.path.join(os.path.dirname(__file__), "data", "myanmar_places.csv")
+NEAR_PLACE_KM = 10  # Closer than this is labelled as the place itself
+
+
+@dataclass(frozen=True)
+class Place:
+    name: str
+    region: str
+    lat: float
+    lon: float
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    lat1, lon1, lat2, lon2 = map(math.radians, (lat1, lon1, lat2, lon2))
+    a = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lon2 - lon1) / 2) ** 2
+    return 2 * 6371 * math.asin(math.sqrt(a))
+
+
+class Gazetteer:
+    """Nearest-place lookup over a CSV of towns, indexed by a 1-degree grid."""
+
+    CELL_DEGREES = 1.0
+
+    def __init__(self, path=GAZETTEER_PATH):
+        with open(path, newline="", encoding="utf-8") as f:
+            self.places = [Place(row["name"], row["region"], float(row["lat"]), float(row["lon"]))
+                           for row in csv.DictReader(f)]
+        self._grid = {}
+        for place in self.places:
+            self._grid.setdefault(self._cell(place.lat, place.lon), []).append(place)
+
+    def _cell(self, lat, lon):
+        return math.floor(lat / self.CELL_DEGREES), math.floor(lon / self.CELL_DEGREES)
+
+    def nearest(self, lat, lon):
+        """Return (place, distance in km) of the closest gazetteer entry.
+
+        Grid rings are searched outwards until the next ring cannot hold
+        anything closer than the best match so far.
+        """
+        row, col = self._cell(lat, lon)
+        best, best_km = None, math.inf
+        max_ring = int(180 / self.CELL_DEGREES)
+        for ring in range(max_ring + 1):
+            for r in range(row - ring, row + ring + 1):
+                for c in range(col - ring, col + ring + 1):
+                    if max(abs(r - row), abs(c - col)) != ring:
+                        continue  # Only the border of this ring is new
+                    for place in self._grid.get((r, c), ()):
+                        km = haversine_km(lat, lon, place.lat, place.lon)
+                        if km < best_km:
+                            best, best_km = place, km
+            # Any cell in the next ring is at least `ring` cells (~111 km each) away
+            if best is not None and best_km <= ring * self.CELL_DEGREES * 111 * math.cos(math.radians(abs(lat))):
+                break
+        return best, best_km
+
+    def label(self, lat, lon):
+        place, km = self.nearest(lat, lon)
+        if place is None:
+            return "Unknown"
+        if km < NEAR_PLACE_KM:
+            return f"{place.name}, {place.region}"
+        return f"{km:.0f} km from {place.name}, {place.region}"
+
+
+class GeocodeCache:
+    """SQLite store of place names keyed by rounded "lat,lon"."""
+
+    def __init__(self, path=GEOCODE_CACHE_PATH, ttl=GEOCODE_CACHE_TTL):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS places (
+                key TEXT PRIMARY KEY,
+                name TEXT NOT NULL,
+                fetched_at REAL NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def get_many(self, keys):
+        keys = list(keys)
+        if not keys:
+            return {}
+        placeholders = ", ".join("?" * len(keys))
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT key, name FROM places WHERE key IN ({placeholders}) AND fetched_at > ?",
+                (*keys, time.time() - self.ttl)).fetchall()
+        return dict(rows)
+
+    def put(self, key, name):
+        with self._lock:
+            self._conn.execute("INSERT OR REPLACE INTO places (key, name, fetched_at) VALUES (?, ?, ?)",
+                               (key, name, time.time()))
+            self._conn.commit()
+
+
+def cache_key(lat, lon):
+    return f"{round(float(lat), GEOCODE_PRECISION)},{round(float(lon), GEOCODE_PRECISION)}"
+
+
+_cache = None
+_gazetteer = None
+_executor = None
+_in_flight = {}  # cache key -> Future, so one location is never fetched twice at once
+_state_lock = threading.Lock()
+_throttle_lock = threading.Lock()
+_next_request_at = 0.0
+
+
+def _services():
+    global _cache, _gazetteer, _executor
+    with _state_lock:
+        if _cache is None:
+            _cache = GeocodeCache()
+            _gazetteer = Gazetteer()
+            _executor = ThreadPoolExecutor(max_workers=GEOCODE_WORKERS, thread_name_prefix="geocode")
+    return _cache, _gazetteer, _executor
+
+
+def _wait_for_turn():
+    """Space requests NOMINATIM_MIN_INTERVAL apart across all threads."""
+    global _next_request_at
+    with _throttle_lock:
+        now = time.monotonic()
+        delay = max(0.0, _next_request_at - now)
+        _next_request_at = max(now, _next_request_at) + NOMINATIM_MIN_INTERVAL
+    if delay:
+        time.sleep(delay)
+
+
+def _fetch_place(key):
+    """Look key up on Nominatim and cache the result; returns the name or None."""
+    cache, _, _ = _services()
+    lat, lon = key.split(",")
+    try:
+        _wait_for_turn()
+        response = get_session().get(NOMINATIM_URL, params={"format": "json", "lat": lat, "lon": lon, "zoom": 10})
+        if response.status_code != 200:
+            return None
+        name = response.json().get("display_name")
+        if name:
+            cache.put(key, name)
+        return name
+    except Exception:
+        return None
+    finally:
+        with _state_lock:
+            _in_flight.pop(key, None)
+
+
+def reverse_geocode_many(points, wait=2.0, online=True):
+    """Label (lat, lon) points with place names without blocking on N HTTP calls.
+
+    Args:
+        points (list[tuple]): (lat, lon) pairs
+        wait (float): Seconds to wait for Nominatim cache misses before
+            falling back to the gazetteer; lookups keep running afterwards
+            and are cached for the next call
+        online (bool): Query Nominatim for cache misses at all
+
+    Returns:
+        list[str]: One label per point, in input order
+    """
+    cache, gazetteer, executor = _services()
+    keys = [cache_key(lat, lon) for lat, lon in points]
+    names = cache.get_many(set(keys))
+
+    if online:
+        futures = {}
+        with _state_lock:
+            for key in dict.fromkeys(keys):
+                if key not in names:
+                    if key not in _in_flight:
+                        _in_flight[key] = executor.submit(_fetch_place, key)
+                    futures[key] = _in_flight[key]
+        done, _ = wait_for(futures.values(), timeout=wait)
+        names.update({key: future.result() for key, future in futures.items()
+                      if future in done and future.result()})
+
+    return [names.get(key) or gazetteer.label(lat, lon) for key, (lat, lon) in zip(keys, points)]
@@ -0,0 +1,57 @@
+# Shared keep-alive HTTP session for the scrapers and the frontend
+
+import os
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+USER_AGENT = "mm-eq-crisis-dashboard/1.0 (+https://github.com/rei-kun01/mm_eq_crisis_dashboard)"
+DEFAULT_TIMEOUT = (5, 30)  # (connect, read) seconds
+POOL_MAXSIZE = int(os.getenv('HTTP_POOL_MAXSIZE', 16))  # Kept-alive connections per host
+
+# urllib3 only decodes brotli responses when a brotli package is importable,
+# so only advertise "br" when it is.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = "gzip, deflate, br"
+    except ImportError:
+        ACCEPT_ENCODING = "gzip, deflate"
+
+
+class TimeoutSession(requests.Session):
+    """requests.Session that applies a default timeout to every request."""
+
+    def __init__(self, timeout=DEFAULT_TIMEOUT):
+        super().__init__()
+        self.timeout = timeout
+
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.timeout)
+        return super().request(method, url, **kwargs)
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session():
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = TimeoutSession()
+                adapter = HTTPAdapter(pool_connections=8, pool_maxsize=POOL_MAXSIZE)
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers.update({
+                    "User-Agent": USER_AGENT,
+                    "Accept-Encoding": ACCEPT_ENCODING,
+                })
+                _session = session
+    return _session